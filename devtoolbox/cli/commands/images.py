@@ -3,7 +3,7 @@ import typer
 from pathlib import Path
 from typing import Optional
 
-from devtoolbox.images.downloader import ImageDownloader
+from devtoolbox.images.downloader import COLLECTOR_WORKERS, ImageDownloader
 from devtoolbox.storage import FileStorage
 
 # Configure logging
@@ -59,6 +59,11 @@ def download_images(
         "-k", "--search-keywords",
         help="Keywords for image search",
     ),
+    workers: int = typer.Option(
+        COLLECTOR_WORKERS,
+        "--workers",
+        help="Number of images downloaded in parallel",
+    ),
     debug: bool = typer.Option(
         False,
         "-d", "--debug",
@@ -83,14 +88,14 @@ def download_images(
     logger.debug(
         "Downloading images with settings: urls=%s, output_dir=%s, "
         "base_filename=%s, max_download=%s, min_width=%s, min_height=%s, "
-        "max_width=%s, enable_search=%s, search_keywords=%s",
+        "max_width=%s, enable_search=%s, search_keywords=%s, workers=%s",
         urls, output_dir, base_filename, max_download, min_width, min_height,
-        max_width, enable_search, search_keywords
+        max_width, enable_search, search_keywords, workers
     )
 
     try:
         # Initialize downloader
-        downloader = ImageDownloader(
+        with ImageDownloader(
             images=urls,
             path_prefix=str(output_path),
             base_filename=base_filename,
@@ -100,11 +105,11 @@ def download_images(
             convert_width=max_width,
             enable_search_download=enable_search,
             search_keywords=search_keywords,
-            storage=storage
-        )
-
-        # Download images
-        downloaded_images = downloader.download_images()
+            storage=storage,
+            workers=workers
+        ) as downloader:
+            # Download images
+            downloaded_images = downloader.download_images()
 
         typer.echo(f"Successfully downloaded {len(downloaded_images)} images:")
         for image_path in downloaded_images:
@@ -1,24 +1,25 @@
+import importlib
 import logging
 import typer
 from pathlib import Path
-from typing import Optional, Dict, Type, List
+from typing import TYPE_CHECKING, Optional, Dict, Tuple, List
 
-from devtoolbox.llm.service import LLMService
-from devtoolbox.llm.openai_provider import OpenAIConfig
-from devtoolbox.llm.azure_openai_provider import AzureOpenAIConfig
-from devtoolbox.llm.deepseek_provider import DeepSeekConfig
-from devtoolbox.llm.provider import BaseLLMConfig
 from devtoolbox.cli.utils import setup_logging
 
+if TYPE_CHECKING:
+    from devtoolbox.llm.provider import BaseLLMConfig
+
 # Configure logging
 logger = logging.getLogger("devtoolbox.llm")
 app = typer.Typer(help="LLM commands")
 
-# Provider configuration mapping
-PROVIDER_CONFIGS: Dict[str, Type[BaseLLMConfig]] = {
-    "openai": OpenAIConfig,
-    "azure": AzureOpenAIConfig,
-    "deepseek": DeepSeekConfig,
+# Provider name -> (module, config class). The provider modules pull in
+# the LLM client libraries, so they are only imported once a provider
+# is actually used.
+PROVIDER_CONFIGS: Dict[str, Tuple[str, str]] = {
+    "openai": ("devtoolbox.llm.openai_provider", "OpenAIConfig"),
+    "azure": ("devtoolbox.llm.azure_openai_provider", "AzureOpenAIConfig"),
+    "deepseek": ("devtoolbox.llm.deepseek_provider", "DeepSeekConfig"),
 }
 
 # Default prompt files
@@ -44,7 +45,7 @@ def callback(
     logger = setup_logging(debug, "devtoolbox.llm")
 
 
-def get_config(provider: str) -> BaseLLMConfig:
+def get_config(provider: str) -> "BaseLLMConfig":
     """Get configuration for the specified provider.
 
     Args:
@@ -61,7 +62,9 @@ def get_config(provider: str) -> BaseLLMConfig:
             f"Unsupported provider: {provider}. "
             f"Supported providers: {', '.join(PROVIDER_CONFIGS.keys())}"
         )
-    return PROVIDER_CONFIGS[provider]()
+    module_name, class_name = PROVIDER_CONFIGS[provider]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)()
 
 
 def load_prompt(
@@ -114,6 +117,9 @@ def process_llm_request(
     Raises:
         typer.Exit: If request fails
     """
+    # Lazy import to speed up CLI startup
+    from devtoolbox.llm.service import LLMService
+
     try:
         # Get configuration and initialize service
         config = get_config(provider)
@@ -4,8 +4,11 @@ This module provides command-line interface for OCR operations.
 """
 
 import logging
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import typer
 
@@ -14,13 +17,20 @@ from devtoolbox.ocr import OCRService
 from devtoolbox.ocr.azure_provider import AzureOCRConfig
 from devtoolbox.ocr.utils import (
     get_provider_requirements,
-    list_supported_providers
+    list_supported_providers,
+    validate_document_for_ocr,
+    validate_image_for_ocr
 )
 
 # Configure logging
 logger = logging.getLogger("devtoolbox.ocr")
 app = typer.Typer(help="OCR commands")
 
+# Files recognized concurrently by recognize-batch by default. OCR
+# requests are network bound, but providers throttle concurrent
+# requests per key.
+DEFAULT_OCR_JOBS = 4
+
 
 @app.callback()
 def callback(
@@ -151,6 +161,205 @@ def recognize(
         raise typer.Exit(1)
 
 
+def _validate_file(
+    args: Tuple[Path, str]
+) -> Tuple[bool, str]:
+    """Validate a single file against provider requirements.
+
+    Defined at module level so it can be pickled into worker processes.
+
+    Args:
+        args: Tuple of (file_path, provider)
+
+    Returns:
+        Tuple of (is_valid, reason)
+    """
+    file_path, provider = args
+    if file_path.suffix.lower() == '.pdf':
+        return validate_document_for_ocr(file_path, provider)
+    return validate_image_for_ocr(file_path, provider)
+
+
+def _prevalidate(
+    paths: List[Path],
+    provider: str = "azure",
+    workers: Optional[int] = None
+) -> Tuple[List[Path], List[Tuple[Path, str]]]:
+    """Validate a batch of files in parallel before any OCR request.
+
+    Image decoding is CPU bound, so validation runs in a process pool
+    and invalid files are filtered out without any network cost.
+
+    Args:
+        paths: Files to validate
+        provider: Provider whose requirements are checked
+        workers: Number of worker processes (default: CPU count)
+
+    Returns:
+        Tuple of (valid_paths, [(invalid_path, reason), ...])
+    """
+    valid = []
+    invalid = []
+    if not paths:
+        return valid, invalid
+
+    max_workers = min(workers or os.cpu_count() or 1, len(paths))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            _validate_file,
+            [(path, provider) for path in paths]
+        )
+        for path, (is_valid, reason) in zip(paths, results):
+            if is_valid:
+                valid.append(path)
+            else:
+                invalid.append((path, reason))
+    return valid, invalid
+
+
+def _stem_collisions(paths: List[Path]) -> Dict[str, List[Path]]:
+    """Find files that would write the same <stem>.txt result.
+
+    Args:
+        paths: Files of the batch
+
+    Returns:
+        Dict of stem => files, for stems shared by several files
+    """
+    by_stem = defaultdict(list)
+    for path in paths:
+        by_stem[path.stem].append(path)
+    return {
+        stem: stem_paths
+        for stem, stem_paths in by_stem.items()
+        if len(stem_paths) > 1
+    }
+
+
+@app.command("recognize-batch")
+def recognize_batch(
+    file_paths: List[Path] = typer.Argument(
+        ...,
+        help="Paths of the files to recognize",
+        exists=True,
+    ),
+    provider: str = typer.Option(
+        "azure",
+        "--provider",
+        "-p",
+        help="OCR provider to use (azure, google, tesseract)",
+    ),
+    api_key: Optional[str] = typer.Option(
+        None,
+        "--api-key",
+        envvar="AZURE_DOCUMENT_INTELLIGENCE_KEY",
+        help="Azure Document Intelligence API key",
+    ),
+    endpoint: Optional[str] = typer.Option(
+        None,
+        "--endpoint",
+        envvar="AZURE_DOCUMENT_INTELLIGENCE_ENDPOINT",
+        help="Azure Document Intelligence endpoint",
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        "-o", "--output-dir",
+        help="Directory to write <name>.txt results (default: stdout)",
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        help="Number of validation processes (default: CPU count)",
+    ),
+    jobs: int = typer.Option(
+        DEFAULT_OCR_JOBS,
+        "--jobs",
+        "-j",
+        help="Number of files recognized concurrently",
+        min=1,
+    ),
+):
+    """
+    Recognize text from multiple files.
+
+    All files are validated in parallel first, so invalid files are
+    reported up front and never sent to the OCR provider. Valid files
+    are then recognized concurrently.
+    """
+    try:
+        if output_dir:
+            collisions = _stem_collisions(file_paths)
+            if collisions:
+                for stem, paths in collisions.items():
+                    typer.echo(
+                        f"Files would overwrite each other's {stem}.txt: "
+                        + ", ".join(str(path) for path in paths)
+                    )
+                raise typer.Exit(1)
+
+        valid, invalid = _prevalidate(file_paths, provider, workers)
+        for path, reason in invalid:
+            logger.warning("Skipping %s: %s", path, reason)
+        logger.info(
+            "%d of %d files passed validation",
+            len(valid),
+            len(file_paths)
+        )
+        if not valid:
+            raise typer.Exit(1 if invalid else 0)
+
+        service = get_service(provider, api_key, endpoint)
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+
+        failed = 0
+        with ThreadPoolExecutor(
+            max_workers=min(jobs, len(valid))
+        ) as executor:
+            # Already validated above, so not validated again
+            futures = [
+                executor.submit(
+                    service.recognize, path,
+                    skip_invalid=True, validate=False
+                )
+                for path in valid
+            ]
+            # Results are written in input order, each as soon as it
+            # and those before it are done
+            for path, future in zip(valid, futures):
+                try:
+                    lines = future.result()
+                except Exception as e:
+                    failed += 1
+                    logger.error("Failed to recognize %s: %s", path, str(e))
+                    continue
+
+                if output_dir:
+                    target = output_dir / f"{path.stem}.txt"
+                    with open(target, 'w', encoding='utf-8') as f:
+                        for line in lines:
+                            f.write(f"{line}\n")
+                else:
+                    typer.echo(f"==> {path} <==")
+                    for line in lines:
+                        typer.echo(line)
+
+        if failed or invalid:
+            raise typer.Exit(1)
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(
+            "Failed to recognize batch: %s",
+            str(e),
+            exc_info=True
+        )
+        typer.echo(f"Failed to recognize batch: {str(e)}")
+        raise typer.Exit(1)
+
+
 @app.command("list-providers")
 def list_providers():
     """List all supported OCR providers."""
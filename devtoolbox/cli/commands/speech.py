@@ -1,14 +1,20 @@
 """
 Speech related commands
 """
+import dataclasses
+import functools
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import tempfile
 import typer
+from enum import Enum
 import logging
 from pathlib import Path
-from devtoolbox.speech.service import SpeechService
-from devtoolbox.speech.whisper_provider import WhisperConfig
-from devtoolbox.speech.azure_provider import AzureConfig
-from devtoolbox.speech.volc_provider import VolcConfig
-from devtoolbox.cli.utils import setup_logging
+from typing import Optional, TYPE_CHECKING
+from devtoolbox.cli.utils import content_hash, setup_logging
 
 
 # Configure logging
@@ -16,18 +22,179 @@ logger = logging.getLogger("devtoolbox.speech")
 app = typer.Typer(help="Speech related commands")
 
 
-# Provider config mapping
+if TYPE_CHECKING:
+    from devtoolbox.speech.service import SpeechService
+
+
+class SpeechProvider(str, Enum):
+    """Speech providers selectable with --provider."""
+    WHISPER = "whisper"
+    AZURE = "azure"
+    VOLC = "volc"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+# Provider config mapping to (module, class name). Provider modules pull
+# in heavy SDKs, so only the requested one is imported.
 PROVIDER_CONFIGS = {
-    "whisper": WhisperConfig,
-    "azure": AzureConfig,
-    "volc": VolcConfig,
+    SpeechProvider.WHISPER: (
+        "devtoolbox.speech.whisper_provider", "WhisperConfig"
+    ),
+    SpeechProvider.AZURE: (
+        "devtoolbox.speech.azure_provider", "AzureConfig"
+    ),
+    SpeechProvider.VOLC: (
+        "devtoolbox.speech.volc_provider", "VolcConfig"
+    ),
 }
 
 
+def _load_config_class(provider: SpeechProvider) -> type:
+    """Import and return the config class for a provider."""
+    module_name, class_name = PROVIDER_CONFIGS[provider]
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_service(provider: SpeechProvider) -> "SpeechService":
+    """Get the speech service for a provider, building it only once.
+
+    Commands invoked repeatedly from a long-running process reuse the
+    same config and provider, including any loaded model.
+    """
+    # Lazy import to speed up CLI startup
+    from devtoolbox.speech.service import SpeechService
+
+    return SpeechService(_load_config_class(provider)())
+
+
+# Persistent caches for synthesized audio and transcripts, shared
+# across invocations
+CACHE_ROOT = Path(
+    os.environ.get(
+        "XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")
+    )
+) / "devtoolbox"
+TTS_CACHE_DIR = CACHE_ROOT / "tts"
+STT_CACHE_DIR = CACHE_ROOT / "stt"
+
+# Segments synthesized in parallel by default. TTS calls are network
+# bound, but providers throttle concurrent requests per key.
+DEFAULT_TTS_JOBS = 4
+
+
+def _tts_cache_path(
+    text_file: Path,
+    provider: SpeechProvider,
+    speaker: Optional[str],
+    rate: int,
+    config_params: str
+) -> Path:
+    """Get the cache file for a synthesis request.
+
+    The key covers everything that changes the produced audio: the text
+    itself, the provider and its settings (which pick the voice when no
+    speaker is given), the speaker and the speech rate.
+    """
+    digest = hashlib.sha256(content_hash(text_file).encode())
+    digest.update(
+        b"|" + provider.value.encode() + b"|" + config_params.encode()
+        + b"|" + (speaker or "").encode() + b"|" + str(rate).encode()
+    )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.speech.service import SpeechService
+
+    return TTS_CACHE_DIR / f"{digest.hexdigest()}.{SpeechService.AUDIO_FORMAT}"
+
+
+def _replace_with_copy(src: Path, dst: Path):
+    """Replace dst with a copy of src.
+
+    Outputs and cache entries never share an inode, since the output is
+    rewritten in place by later syntheses. dst is unlinked first, so an
+    output still hardlinked to a cache entry is not written through.
+    """
+    if dst.exists():
+        dst.unlink()
+    shutil.copyfile(src, dst)
+
+
+def _store_in_tts_cache(output_file: Path, cache_path: Path):
+    """Add a synthesized file to the cache without exposing partial files.
+
+    The file is first copied to a temporary name inside the cache
+    directory and then atomically renamed into place.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_path.parent, suffix=".tmp"
+    )
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        _replace_with_copy(output_file, tmp_path)
+        os.replace(tmp_path, cache_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def _stt_cache_dir(audio_file: Path, *params) -> Path:
+    """Get the cache entry directory for a transcription request.
+
+    Every parameter that affects the transcript is part of the key.
+    """
+    digest = hashlib.sha256(content_hash(audio_file).encode())
+    for param in params:
+        digest.update(b"|" + str(param).encode())
+    return STT_CACHE_DIR / digest.hexdigest()
+
+
+def _config_params(config) -> str:
+    """Get the settings of a provider config as a stable string.
+
+    Credentials (fields ending in "_key") are left out, so they never
+    end up in cache keys and rotating them keeps cached entries valid.
+    """
+    params = {
+        name: value
+        for name, value in dataclasses.asdict(config).items()
+        if not name.endswith("_key")
+    }
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _store_in_stt_cache(
+    entry_dir: Path,
+    output_file: Path,
+    metadata_file: Path
+):
+    """Save a transcript and its metadata as a cache entry.
+
+    The entry is assembled in a temporary directory and renamed into
+    place so concurrent readers never see a partial entry.
+    """
+    STT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=STT_CACHE_DIR, suffix=".tmp"))
+    try:
+        shutil.copyfile(output_file, tmp_dir / "output")
+        shutil.copyfile(metadata_file, tmp_dir / "metadata.json")
+        os.replace(tmp_dir, entry_dir)
+    except OSError as e:
+        # Another process may have stored the same entry meanwhile
+        logger.debug("Could not store transcript in cache: %s", str(e))
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 # Common provider option
 PROVIDER_OPTION = typer.Option(
     ...,
     "-p", "--provider",
+    case_sensitive=False,
     help=(
         "Provider type (whisper: STT only, azure: TTS & STT, "
         "volc: TTS only)"
@@ -68,7 +235,7 @@ def text_to_speech(
         file_okay=True,
         dir_okay=False,
     ),
-    provider: str = PROVIDER_OPTION,
+    provider: SpeechProvider = PROVIDER_OPTION,
     speaker: str = typer.Option(
         None,
         "-s", "--speaker",
@@ -84,40 +251,79 @@ def text_to_speech(
         "--use-cache/--no-cache",
         help="Whether to use cache",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_TTS_JOBS,
+        "-j", "--jobs",
+        help="Number of text segments synthesized in parallel",
+        min=1,
+    ),
+    tts_disk_cache: bool = typer.Option(
+        True,
+        "--tts-disk-cache/--no-tts-disk-cache",
+        help=(
+            "Reuse audio synthesized earlier for the same text, provider "
+            f"settings, speaker and rate (stored in {TTS_CACHE_DIR}); "
+            "not used with --no-cache"
+        ),
+    ),
 ):
     """
     Convert text to speech
     """
     logger.debug(
         "Converting text to speech: %s -> %s (provider=%s, speaker=%s, "
-        "rate=%s, use_cache=%s)",
-        text_file, output_file, provider, speaker, rate, use_cache
+        "rate=%s, use_cache=%s, jobs=%s, tts_disk_cache=%s)",
+        text_file, output_file, provider, speaker, rate, use_cache,
+        jobs, tts_disk_cache
     )
 
     try:
-        # Validate provider
-        if provider.lower() not in PROVIDER_CONFIGS:
-            raise typer.BadParameter(
-                f"Provider must be one of: {', '.join(PROVIDER_CONFIGS.keys())}"
-            )
+        # Get the (cached) service for this provider
+        service = _get_service(provider)
 
-        # Initialize service with provider config
-        config_class = PROVIDER_CONFIGS[provider.lower()]
-        service = SpeechService(config_class())
+        # Serve repeated requests from the disk cache without calling
+        # the provider at all
+        tts_disk_cache = tts_disk_cache and use_cache
+        cache_path = _tts_cache_path(
+            text_file, provider, speaker, rate,
+            _config_params(service.config)
+        )
+        if tts_disk_cache and cache_path.exists():
+            logger.info("Using cached audio: %s", cache_path)
+            _replace_with_copy(cache_path, output_file)
+            typer.echo(
+                f"Successfully converted text to speech: {output_file}"
+            )
+            return
 
-        # Read text file
-        with open(text_file) as f:
-            text = f.read()
+        # Outputs served by earlier versions may still be hardlinks to
+        # cache entries, which synthesizing in place would overwrite
+        if output_file.exists() and output_file.stat().st_nlink > 1:
+            output_file.unlink()
 
-        # Convert text to speech
-        service.text_to_speech(
-            text,
+        # Convert text to speech, streaming the file instead of reading
+        # it at once. With the disk cache enabled, every sentence is
+        # cached on its own so that an edited script only re-synthesizes
+        # the sentences that changed
+        tts_kwargs = {}
+        if tts_disk_cache:
+            tts_kwargs = {
+                "cache_dir": str(TTS_CACHE_DIR / "sentences"),
+                "sentence_level": True,
+            }
+        service.text_file_to_speech(
+            str(text_file),
             str(output_file),
             use_cache=use_cache,
             speaker=speaker,
-            rate=rate
+            rate=rate,
+            jobs=jobs,
+            **tts_kwargs
         )
 
+        if tts_disk_cache:
+            _store_in_tts_cache(output_file, cache_path)
+
         typer.echo(f"Successfully converted text to speech: {output_file}")
     except Exception as e:
         logger.error(
@@ -146,7 +352,7 @@ def speech_to_text(
         file_okay=True,
         dir_okay=False,
     ),
-    provider: str = PROVIDER_OPTION,
+    provider: SpeechProvider = PROVIDER_OPTION,
     output_format: str = typer.Option(
         "txt",
         "-f", "--format",
@@ -177,27 +383,63 @@ def speech_to_text(
         "--max-wait-for-silence",
         help="Max wait for silence after max chunk duration (ms, default: 120000)",
     ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "-j", "--jobs",
+        help=(
+            "Number of chunks transcribed in parallel (ignored by "
+            "providers that run locally, such as whisper)"
+        ),
+        min=1,
+    ),
+    stt_disk_cache: bool = typer.Option(
+        True,
+        "--stt-disk-cache/--no-stt-disk-cache",
+        help=(
+            "Reuse the transcript of identical audio processed earlier "
+            f"with the same settings (stored in {STT_CACHE_DIR}); "
+            "not used with --no-cache"
+        ),
+    ),
 ):
     """
     Convert speech to text
     """
     logger.debug(
-        f"Converting speech to text: {audio_file} -> {output_file} "
-        f"(provider={provider}, format={output_format}, use_cache={use_cache}, "
-        f"min_chunk_duration={min_chunk_duration}, max_chunk_duration={max_chunk_duration}, "
-        f"vad_aggressiveness={vad_aggressiveness}, max_wait_for_silence={max_wait_for_silence})"
+        "Converting speech to text: %s -> %s (provider=%s, format=%s, "
+        "use_cache=%s, min_chunk_duration=%s, max_chunk_duration=%s, "
+        "vad_aggressiveness=%s, max_wait_for_silence=%s)",
+        audio_file, output_file, provider, output_format, use_cache,
+        min_chunk_duration, max_chunk_duration, vad_aggressiveness,
+        max_wait_for_silence
     )
 
     try:
-        # Validate provider
-        if provider.lower() not in PROVIDER_CONFIGS:
-            raise typer.BadParameter(
-                f"Provider must be one of: {', '.join(PROVIDER_CONFIGS.keys())}"
-            )
+        # Get the (cached) service for this provider
+        service = _get_service(provider)
 
-        # Initialize service with provider config
-        config_class = PROVIDER_CONFIGS[provider.lower()]
-        service = SpeechService(config_class())
+        # Serve identical audio processed with the same settings from
+        # the disk cache without splitting or transcribing it again
+        metadata_file = Path(f"{output_file}.metadata.json")
+        entry_dir = None
+        if stt_disk_cache and use_cache:
+            entry_dir = _stt_cache_dir(
+                audio_file, provider, _config_params(service.config),
+                output_format, min_chunk_duration, max_chunk_duration,
+                vad_aggressiveness, max_wait_for_silence
+            )
+            if (entry_dir / "output").exists():
+                logger.info("Using cached transcript: %s", entry_dir)
+                shutil.copyfile(entry_dir / "output", output_file)
+                shutil.copyfile(
+                    entry_dir / "metadata.json", metadata_file
+                )
+                typer.echo(
+                    f"Successfully converted speech to text: {output_file}"
+                )
+                typer.echo(f"Metadata file: {metadata_file}")
+                typer.echo(f"Cache entry: {entry_dir}")
+                return
 
         # Convert speech to text
         result = service.speech_to_text(
@@ -208,17 +450,25 @@ def speech_to_text(
             min_chunk_duration=min_chunk_duration,
             max_chunk_duration=max_chunk_duration,
             vad_aggressiveness=vad_aggressiveness,
-            max_wait_for_silence=max_wait_for_silence
+            max_wait_for_silence=max_wait_for_silence,
+            jobs=jobs
         )
 
+        if entry_dir is not None:
+            _store_in_stt_cache(
+                entry_dir,
+                Path(result["output_path"]),
+                Path(result["metadata_path"])
+            )
+
         typer.echo(f"Successfully converted speech to text: {result['output_path']}")
         typer.echo(f"Metadata file: {result['metadata_path']}")
         typer.echo(f"Chunks directory: {result['chunks_path']}")
     except Exception as e:
         logger.error(
-            f"Failed to convert speech to text: input={audio_file}, "
-            f"output={output_file}, provider={provider}, format={output_format}, "
-            f"error={str(e)}",
+            "Failed to convert speech to text: input=%s, output=%s, "
+            "provider=%s, format=%s, error=%s",
+            audio_file, output_file, provider, output_format, str(e),
             exc_info=True
         )
         typer.echo(f"Failed to convert speech to text: {str(e)}")
@@ -244,17 +494,12 @@ def setup_llm(
     setup_logging(debug)
     logger = logging.getLogger(__name__)
 
-    try:
-        logger.warning(
-            "This command is deprecated. Use 'devtoolbox whisper download' "
-            "instead for better Whisper model management."
-        )
+    logger.warning(
+        "This command is deprecated. Use 'devtoolbox whisper download' "
+        "instead for better Whisper model management."
+    )
 
-        # Use the existing whisper download functionality
-        import whisper
-        logger.info(f"Pre-downloading Whisper {model_size} model...")
-        whisper.load_model(model_size)
-        logger.info(f"Successfully downloaded Whisper {model_size} model")
-    except Exception as e:
-        logger.error(f"Failed to download Whisper model: {str(e)}")
-        raise typer.Exit(1)
\ No newline at end of file
+    # Reuse the whisper download command, which skips checkpoints that
+    # are already cached and never loads the model into memory
+    from devtoolbox.cli.commands.whisper import download
+    download(model_size=model_size, debug=debug)
@@ -1,12 +1,29 @@
 """
 Storage related commands
 """
+import functools
+import inspect
+import os
+import shutil
+import sys
+import threading
 import typer
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 import logging
-from typing import Optional
-from devtoolbox.storage import ObjectStorage, FileStorage
-from devtoolbox.cli.utils import setup_logging
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_exponential,
+    before_sleep_log
+)
+from devtoolbox.cli.utils import content_hash, setup_logging
+
+if TYPE_CHECKING:
+    from devtoolbox.storage import ObjectStorage
 
 
 # Configure logging
@@ -30,16 +47,34 @@ def callback(
     logger = setup_logging(debug, "devtoolbox.storage")
 
 
-def _get_storage(storage_type: str, bucket: Optional[str] = None,
-                 endpoint: Optional[str] = None, access_key: Optional[str] = None,
-                 secret_key: Optional[str] = None, region: Optional[str] = None,
-                 use_virtual_style: bool = False, base_path: str = "."):
+class StorageType(str, Enum):
+    """Storage backends selectable with --type."""
+    FILE = "file"
+    OBJECT = "object"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@functools.lru_cache(maxsize=8)
+def _make_storage(storage_type: StorageType, bucket: Optional[str] = None,
+                  endpoint: Optional[str] = None,
+                  access_key: Optional[str] = None,
+                  secret_key: Optional[str] = None,
+                  region: Optional[str] = None,
+                  use_virtual_style: bool = False, base_path: str = "."):
     """
     Helper function to create storage instance based on type and parameters
+
+    Instances are cached per parameters, so commands run repeatedly in
+    one process (scripts, tests) reuse the client and its connections.
     """
-    if storage_type.lower() == "file":
+    # Lazy import to speed up CLI startup
+    from devtoolbox.storage import ObjectStorage, FileStorage
+
+    if storage_type is StorageType.FILE:
         return FileStorage(base_path)
-    elif storage_type.lower() == "object":
+    elif storage_type is StorageType.OBJECT:
         if not all([bucket, endpoint, access_key, secret_key]):
             raise ValueError(
                 "bucket, endpoint, access_key, and secret_key are "
@@ -57,71 +92,472 @@ def _get_storage(storage_type: str, bucket: Optional[str] = None,
         raise ValueError(f"Unsupported storage type: {storage_type}")
 
 
+@dataclass
+class StorageOptions:
+    """Storage selection options shared by all storage commands."""
+    storage_type: StorageType = StorageType.FILE
+    bucket: Optional[str] = None
+    endpoint: Optional[str] = None
+    access_key: Optional[str] = None
+    secret_key: Optional[str] = None
+    region: Optional[str] = None
+    use_virtual_style: bool = False
+
+    def has_object_credentials(self) -> bool:
+        """Check whether all object storage settings are present."""
+        return all([
+            self.bucket, self.endpoint, self.access_key, self.secret_key
+        ])
+
+    def create(self, base_path: str = "."):
+        """Create the storage described by these options."""
+        return _make_storage(
+            self.storage_type, self.bucket, self.endpoint,
+            self.access_key, self.secret_key, self.region,
+            self.use_virtual_style, base_path
+        )
+
+
+# Options added to every storage command by with_storage_options
+_STORAGE_PARAMETERS = [
+    inspect.Parameter(
+        name, inspect.Parameter.KEYWORD_ONLY,
+        default=default, annotation=annotation
+    )
+    for name, annotation, default in [
+        ("storage_type", StorageType, typer.Option(
+            StorageType.FILE,
+            "-t", "--type",
+            help="Storage type",
+            case_sensitive=False,
+        )),
+        ("bucket", Optional[str], typer.Option(
+            None,
+            "-b", "--bucket",
+            help="Bucket name for object storage",
+        )),
+        ("endpoint", Optional[str], typer.Option(
+            None,
+            "-e", "--endpoint",
+            help="Endpoint URL for object storage",
+        )),
+        ("access_key", Optional[str], typer.Option(
+            None,
+            "-k", "--access-key",
+            help="Access key for object storage",
+        )),
+        ("secret_key", Optional[str], typer.Option(
+            None,
+            "-s", "--secret-key",
+            help="Secret key for object storage",
+        )),
+        ("region", Optional[str], typer.Option(
+            None,
+            "-r", "--region",
+            help="Region for object storage",
+        )),
+        ("use_virtual_style", bool, typer.Option(
+            False,
+            "-v", "--virtual-style",
+            help="Use virtual style endpoint for object storage",
+        )),
+    ]
+]
+
+
+def with_storage_options(func):
+    """Add the shared storage options to a command.
+
+    The decorated function declares an ``opts`` parameter instead of the
+    individual options and receives them bundled in a StorageOptions.
+    """
+    signature = inspect.signature(func)
+    parameters = [
+        param for name, param in signature.parameters.items()
+        if name != "opts"
+    ]
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        opts = StorageOptions(**{
+            param.name: kwargs.pop(param.name)
+            for param in _STORAGE_PARAMETERS
+        })
+        return func(*args, opts=opts, **kwargs)
+
+    wrapper.__signature__ = signature.replace(
+        parameters=parameters + _STORAGE_PARAMETERS
+    )
+    wrapper.__annotations__ = {
+        name: annotation
+        for name, annotation in func.__annotations__.items()
+        if name != "opts"
+    }
+    wrapper.__annotations__.update({
+        param.name: param.annotation for param in _STORAGE_PARAMETERS
+    })
+    return wrapper
+
+
+# Default number of files transferred in parallel by batch uploads and
+# downloads
+DEFAULT_BATCH_CONCURRENCY = min(32, (os.cpu_count() or 1) * 4)
+
+# Files above this size are sent to object storage as a parallel
+# multipart upload with parts of MULTIPART_CHUNK_SIZE bytes. Parts of
+# 16 MiB keep the per-request overhead low without holding too much in
+# memory per upload thread.
+MULTIPART_THRESHOLD = 32 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Default number of parallel ranged GETs for object storage downloads
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
+
+# Buffer size used when streaming a stored file into a local one
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class _TransferProgress:
+    """Adapter driving a typer progress bar from object storage transfers.
+
+    Updates may come from several threads during parallel transfers.
+    """
+
+    def __init__(self, action: str = "Uploading"):
+        self._action = action
+        self._bar = None
+        self._lock = threading.Lock()
+
+    def set_meta(self, object_name: str, total_length: int):
+        self._bar = typer.progressbar(
+            length=total_length,
+            label=f"{self._action} {object_name}"
+        )
+        self._bar.__enter__()
+
+    def update(self, length: int):
+        if self._bar is not None:
+            with self._lock:
+                self._bar.update(length)
+
+    def close(self):
+        if self._bar is not None:
+            self._bar.__exit__(None, None, None)
+            self._bar = None
+
+
+def _collect_uploads(
+    sources: List[Path],
+    dest: str
+) -> List[Tuple[Path, str]]:
+    """Expand upload sources into (local_file, destination) pairs.
+
+    A single file is uploaded to dest as is. When several sources or a
+    directory are given, dest is treated as a prefix and each file keeps
+    its name (or its path relative to the given directory).
+    """
+    if len(sources) == 1 and sources[0].is_file():
+        return [(sources[0], dest)]
+
+    prefix = dest.rstrip("/")
+    uploads = []
+    for source in sources:
+        if source.is_dir():
+            for file_path in sorted(source.rglob("*")):
+                if file_path.is_file():
+                    rel_path = file_path.relative_to(source).as_posix()
+                    uploads.append((file_path, f"{prefix}/{rel_path}"))
+        else:
+            uploads.append((source, f"{prefix}/{source.name}"))
+    return uploads
+
+
+def _split_duplicates(
+    uploads: List[Tuple[Path, str]],
+    workers: int
+) -> Tuple[List[Tuple[Path, str]], List[Tuple[Path, str, str]]]:
+    """Separate uploads whose content repeats an earlier upload.
+
+    Only files sharing their size with another file are hashed, on a
+    thread pool. Returns the uploads to transfer and, for every
+    duplicate, (source, destination, destination of the first copy).
+    """
+    by_size = {}
+    for source, target in uploads:
+        by_size.setdefault(source.stat().st_size, []).append(
+            (source, target)
+        )
+    candidates = [
+        upload for group in by_size.values() if len(group) > 1
+        for upload in group
+    ]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = dict(zip(
+            candidates,
+            executor.map(lambda upload: content_hash(upload[0]), candidates)
+        ))
+
+    unique = []
+    duplicates = []
+    primaries = {}
+    for source, target in uploads:
+        digest = digests.get((source, target))
+        if digest is not None and digest in primaries:
+            duplicates.append((source, target, primaries[digest]))
+            continue
+        if digest is not None:
+            primaries[digest] = target
+        unique.append((source, target))
+    return unique, duplicates
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+def _copy_with_retry(storage, src: str, dest: str):
+    """Copy within storage, retrying transient failures with backoff."""
+    return storage.copy(src, dest)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+def _upload_with_retry(
+    storage,
+    source: Path,
+    dest: str,
+    direct: bool = False,
+    **kwargs
+):
+    """Upload a single file, retrying transient failures with backoff."""
+    if direct:
+        return _direct_upload(storage, source, dest)
+    return storage.cp_from_path(str(source), dest, **kwargs)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=1, max=10),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True
+)
+def _download_with_retry(storage, source: str, dest: Path):
+    """Download a single file, retrying transient failures with backoff."""
+    from devtoolbox.storage import ObjectStorage
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(storage, ObjectStorage):
+        return storage.download(source, str(dest), show_progress=False)
+    return shutil.copyfile(storage.full_path(source), dest)
+
+
+def _direct_upload(storage: "ObjectStorage", source: Path, dest: str):
+    """Upload a file with a plain HTTP PUT to a presigned URL.
+
+    The file object is handed to requests, which streams it from disk
+    instead of loading it into memory.
+    """
+    import requests  # Lazy import to speed up CLI startup
+
+    url = storage.get_presigned_upload_url(dest)
+    size = source.stat().st_size
+    with open(source, "rb") as f:
+        response = requests.put(
+            url, data=f, headers={"Content-Length": str(size)}
+        )
+    response.raise_for_status()
+
+
+def _direct_download(
+    storage: "ObjectStorage",
+    source: str,
+    dest: Path,
+    chunk_size: int = 8 * 1024 * 1024
+):
+    """Download an object with a streamed HTTP GET to a presigned URL."""
+    import requests  # Lazy import to speed up CLI startup
+
+    url = storage.get_presigned_download_url(source)
+    with requests.get(url, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(response.raw, f, chunk_size)
+
+
+def _stream_to_file(storage, source: str, dest: Path):
+    """Stream a stored file into a local file without loading it whole."""
+    with storage.open(source) as src, \
+            open(dest, "wb", buffering=COPY_BUFFER_SIZE) as f:
+        shutil.copyfileobj(src, f, COPY_BUFFER_SIZE)
+
+
+def _multipart_options(
+    storage,
+    source: Path,
+    concurrency: int
+) -> dict:
+    """Get multipart upload options for large object storage uploads."""
+    from devtoolbox.storage import ObjectStorage
+
+    if not isinstance(storage, ObjectStorage):
+        return {}
+    if source.stat().st_size <= MULTIPART_THRESHOLD:
+        return {}
+    return {
+        "part_size": MULTIPART_CHUNK_SIZE,
+        "num_parallel_uploads": concurrency,
+    }
+
+
 @app.command("upload")
+@with_storage_options
 def upload(
-    source: Path = typer.Argument(
+    sources: List[Path] = typer.Argument(
         ...,
-        help="Source file path",
+        help=(
+            "Source file(s) or directories. With more than one file, "
+            "dest is used as a prefix"
+        ),
         exists=True,
         file_okay=True,
-        dir_okay=False,
+        dir_okay=True,
     ),
     dest: str = typer.Argument(
         ...,
         help="Destination path in storage",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY,
+        "-c", "--concurrency",
+        help="Number of files uploaded in parallel",
+        min=1,
     ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
+    direct: bool = typer.Option(
         False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
+        "--direct/--via-client",
+        help=(
+            "Object storage only: transfer with plain HTTP through a "
+            "presigned URL instead of the storage client"
+        ),
+    ),
+    dedupe: bool = typer.Option(
+        True,
+        "--dedupe/--no-dedupe",
+        help=(
+            "Transfer files with identical content once and copy them "
+            "within storage for the other destinations"
+        ),
     ),
+    opts: StorageOptions = None,
 ):
     """
-    Upload a file to storage
+    Upload files to storage
     """
     logger.debug(
-        "Uploading file %s to %s using %s storage",
-        source, dest, storage_type
+        "Uploading %s to %s using %s storage",
+        sources, dest, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style, str(source.parent)
+        uploads = _collect_uploads(sources, dest)
+        if not uploads:
+            typer.echo("No files to upload")
+            raise typer.Exit(1)
+
+        base_path = os.path.commonpath(
+            [str(source.parent.resolve()) for source in sources]
         )
-        storage.cp_from_path(str(source), dest)
-        typer.echo(f"Successfully uploaded {source} to {dest}")
+        storage = opts.create(base_path)
+        if direct and opts.storage_type is not StorageType.OBJECT:
+            raise ValueError("--direct is only supported for object storage")
+
+        # A single large file is uploaded in parallel parts with a
+        # progress bar instead of going through the thread pool
+        if len(uploads) == 1:
+            source, target = uploads[0]
+            options = {"direct": direct}
+            if not direct:
+                options.update(
+                    _multipart_options(storage, source, concurrency)
+                )
+            progress = None
+            if "part_size" in options:
+                progress = _TransferProgress()
+                options["progress"] = progress
+            try:
+                _upload_with_retry(storage, source, target, **options)
+            finally:
+                if progress:
+                    progress.close()
+            typer.echo(f"Successfully uploaded {source} to {target}")
+            return
+
+        failed = 0
+        workers = min(concurrency, len(uploads))
+        duplicates = []
+        if dedupe:
+            uploads, duplicates = _split_duplicates(uploads, workers)
+            if duplicates:
+                logger.info(
+                    "Skipping transfer of %d duplicate file(s)",
+                    len(duplicates)
+                )
+        uploaded = set()
+
+        def wait_for(futures) -> int:
+            errors = 0
+            for future in as_completed(futures):
+                source, target = futures[future]
+                try:
+                    future.result()
+                    uploaded.add(target)
+                    typer.echo(f"Successfully uploaded {source} to {target}")
+                except Exception as e:
+                    errors += 1
+                    logger.error(
+                        "Failed to upload %s: %s", source, str(e)
+                    )
+                    typer.echo(f"Failed to upload {source}: {str(e)}")
+            return errors
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            failed += wait_for({
+                executor.submit(
+                    _upload_with_retry, storage, source, target,
+                    direct=direct,
+                    **_multipart_options(storage, source, 1)
+                ): (source, target)
+                for source, target in uploads
+            })
+
+            # Duplicates are copied from their first upload inside the
+            # storage; they are transferred only if that upload failed
+            failed += wait_for({
+                executor.submit(
+                    _copy_with_retry, storage, primary, target
+                ) if primary in uploaded else executor.submit(
+                    _upload_with_retry, storage, source, target,
+                    direct=direct,
+                    **_multipart_options(storage, source, 1)
+                ): (source, target)
+                for source, target, primary in duplicates
+            })
+
+        if failed:
+            typer.echo(
+                f"{failed} of {len(uploads) + len(duplicates)} uploads "
+                "failed"
+            )
+            raise typer.Exit(1)
+    except typer.Exit:
+        raise
     except Exception as e:
         logger.error(
             "Failed to upload file: %s",
@@ -133,6 +569,7 @@ def upload(
 
 
 @app.command("download")
+@with_storage_options
 def download(
     source: str = typer.Argument(
         ...,
@@ -142,68 +579,53 @@ def download(
         ...,
         help="Destination file path",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
+    direct: bool = typer.Option(
         False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+        "--direct/--via-client",
+        help=(
+            "Object storage only: transfer with plain HTTP through a "
+            "presigned URL instead of the storage client"
+        ),
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_DOWNLOAD_CONCURRENCY,
+        "-c", "--concurrency",
+        help="Object storage only: number of parts downloaded in parallel",
+        min=1,
+    ),
+    opts: StorageOptions = None,
 ):
     """
     Download a file from storage
     """
     logger.debug(
         "Downloading file %s to %s using %s storage",
-        source, dest, storage_type
+        source, dest, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style, str(dest.parent)
-        )
+        storage = opts.create(str(dest.parent))
 
-        if storage_type.lower() == "object":
-            # Object storage has download method
-            storage.download(source, str(dest))
+        if direct and opts.storage_type is not StorageType.OBJECT:
+            raise ValueError("--direct is only supported for object storage")
+
+        if direct:
+            _direct_download(storage, source, dest)
+        elif opts.storage_type is StorageType.OBJECT:
+            # Large objects are fetched as parallel ranged GETs of
+            # MULTIPART_CHUNK_SIZE bytes with a progress bar
+            progress = _TransferProgress("Downloading")
+            try:
+                storage.download(
+                    source, str(dest),
+                    chunk_size=MULTIPART_CHUNK_SIZE,
+                    concurrency=concurrency,
+                    progress=progress
+                )
+            finally:
+                progress.close()
         else:
-            # File storage - use read and write
-            content = storage.read(source)
-            with open(dest, 'wb') as f:
-                if isinstance(content, str):
-                    f.write(content.encode())
-                else:
-                    f.write(content)
+            _stream_to_file(storage, source, dest)
 
         typer.echo(f"Successfully downloaded {source} to {dest}")
     except Exception as e:
@@ -216,7 +638,101 @@ def download(
         raise typer.Exit(1)
 
 
+@app.command("download-many")
+@with_storage_options
+def download_many(
+    source: str = typer.Argument(
+        ...,
+        help="Prefix (object storage) or directory (file storage)",
+    ),
+    dest: Path = typer.Argument(
+        ...,
+        help="Local directory to download into",
+        file_okay=False,
+        dir_okay=True,
+    ),
+    pattern: str = typer.Option(
+        "*",
+        "-p", "--pattern",
+        help="File pattern to match",
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY,
+        "-c", "--concurrency",
+        help="Number of files downloaded in parallel",
+        min=1,
+    ),
+    opts: StorageOptions = None,
+):
+    """
+    Download all matching files under a prefix or directory
+    """
+    logger.debug(
+        "Downloading files under %s matching %s to %s using %s storage",
+        source, pattern, dest, opts.storage_type
+    )
+
+    try:
+        if opts.storage_type is StorageType.OBJECT:
+            storage = opts.create()
+        else:
+            storage = opts.create(source)
+
+        # Object names are full keys under the prefix; file storage is
+        # rooted at the source directory, so its whole tree is listed
+        # and names are already relative to it
+        if opts.storage_type is StorageType.OBJECT:
+            prefix = listing_path = source
+        else:
+            prefix = listing_path = ""
+        downloads = []
+        for name in storage.iter_ls(listing_path, pattern):
+            rel_path = name[len(prefix):].lstrip("/")
+            downloads.append((name, dest / rel_path))
+        if not downloads:
+            typer.echo("No files found")
+            raise typer.Exit(1)
+
+        # One storage client is shared by all workers so connections
+        # are pooled across files
+        failed = 0
+        workers = min(concurrency, len(downloads))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    _download_with_retry, storage, name, target
+                ): (name, target)
+                for name, target in downloads
+            }
+            for future in as_completed(futures):
+                name, target = futures[future]
+                try:
+                    future.result()
+                    typer.echo(f"Successfully downloaded {name} to {target}")
+                except Exception as e:
+                    failed += 1
+                    logger.error(
+                        "Failed to download %s: %s", name, str(e)
+                    )
+                    typer.echo(f"Failed to download {name}: {str(e)}")
+
+        if failed:
+            typer.echo(f"{failed} of {len(downloads)} downloads failed")
+            raise typer.Exit(1)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        logger.error(
+            "Failed to download files: %s",
+            str(e),
+            exc_info=True
+        )
+        typer.echo(f"Failed to download files: {str(e)}")
+        raise typer.Exit(1)
+
+
 @app.command("read")
+@with_storage_options
 def read_file(
     path: str = typer.Argument(
         ...,
@@ -232,68 +748,33 @@ def read_file(
         "-c", "--content-type",
         help="Content type of the file",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Read content from storage
     """
     logger.debug(
         "Reading file %s using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style
-        )
-        content = storage.read(path, content_type=content_type)
+        storage = opts.create()
 
         if output_file:
-            # Write to file
-            with open(output_file, 'wb') as f:
-                if isinstance(content, str):
-                    f.write(content.encode())
-                else:
-                    f.write(content)
+            # The raw bytes are written as is, so stream them rather
+            # than reading the whole file into memory
+            _stream_to_file(storage, path, output_file)
             typer.echo(f"Successfully read {path} to {output_file}")
+        elif not sys.stdout.isatty():
+            # Piped output gets the raw bytes, streamed without decoding
+            sys.stdout.flush()
+            with storage.open(path) as src:
+                shutil.copyfileobj(src, sys.stdout.buffer, COPY_BUFFER_SIZE)
+            sys.stdout.buffer.flush()
         else:
             # Print to stdout
+            content = storage.read(path, content_type=content_type)
             if isinstance(content, bytes):
                 typer.echo(content.decode())
             else:
@@ -309,72 +790,71 @@ def read_file(
 
 
 @app.command("write")
+@with_storage_options
 def write_file(
     path: str = typer.Argument(
         ...,
         help="Path to write to storage",
     ),
-    content: str = typer.Argument(
-        ...,
-        help="Content to write",
-    ),
-    content_type: str = typer.Option(
-        "text",
-        "-c", "--content-type",
-        help="Content type of the file",
-    ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
+    content: Optional[str] = typer.Argument(
         None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
+        help="Content to write (or use --input/--stdin for large data)",
     ),
-    access_key: Optional[str] = typer.Option(
+    input_file: Optional[Path] = typer.Option(
         None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
+        "-i", "--input",
+        help="Stream the content from this file",
+        exists=True,
+        dir_okay=False,
     ),
-    use_virtual_style: bool = typer.Option(
+    stdin: bool = typer.Option(
         False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
+        "--stdin",
+        help="Stream the content from standard input",
     ),
+    content_type: str = typer.Option(
+        "text",
+        "-c", "--content-type",
+        help="Content type of the file",
+    ),
+    opts: StorageOptions = None,
 ):
     """
     Write content to storage
     """
     logger.debug(
         "Writing content to %s using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
-    try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style
+    sources = [content is not None, input_file is not None, stdin]
+    if sources.count(True) != 1:
+        typer.echo(
+            "Specify exactly one of CONTENT, --input or --stdin"
         )
-        result = storage.write(path, content, content_type=content_type)
-        typer.echo(f"Successfully wrote {len(content)} characters to {path}")
+        raise typer.Exit(1)
+
+    try:
+        storage = opts.create()
+        if content is not None:
+            storage.write(path, content, content_type=content_type)
+            typer.echo(
+                f"Successfully wrote {len(content)} characters to {path}"
+            )
+            return
+
+        # Bytes go straight from the source to storage instead of
+        # passing through a full-size string
+        if stdin:
+            storage.write_stream(
+                path, sys.stdin.buffer, content_type=content_type
+            )
+            source = "standard input"
+        else:
+            with open(input_file, "rb", buffering=COPY_BUFFER_SIZE) as f:
+                storage.write_stream(path, f, content_type=content_type)
+            source = input_file
+        typer.echo(f"Successfully wrote {source} to {path}")
     except Exception as e:
         logger.error(
             "Failed to write file: %s",
@@ -386,6 +866,7 @@ def write_file(
 
 
 @app.command("url")
+@with_storage_options
 def get_url(
     path: str = typer.Argument(
         ...,
@@ -396,58 +877,20 @@ def get_url(
         "-p", "--permanent",
         help="Generate permanent URL (for object storage)",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Generate URL for file in storage
     """
     logger.debug(
         "Generating URL for %s using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style
-        )
+        storage = opts.create()
 
-        if storage_type.lower() == "object":
+        if opts.storage_type is StorageType.OBJECT:
             url = storage.full_path(path, permanent=permanent)
         else:
             # For file storage, just return the full path
@@ -465,6 +908,7 @@ def get_url(
 
 
 @app.command("presigned-url")
+@with_storage_options
 def get_presigned_url(
     path: str = typer.Argument(
         ...,
@@ -481,60 +925,22 @@ def get_presigned_url(
         "-e", "--expires",
         help="Expiration time in minutes",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Generate presigned URL for file in storage
     """
     logger.debug(
         "Generating presigned URL for %s using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
     try:
-        if storage_type.lower() != "object":
+        if opts.storage_type is not StorageType.OBJECT:
             typer.echo("Presigned URLs are only supported for object storage")
             raise typer.Exit(1)
 
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style
-        )
+        storage = opts.create()
 
         if operation.lower() == "get":
             url = storage.get_presigned_download_url(path, expires_minutes)
@@ -556,86 +962,54 @@ def get_presigned_url(
 
 
 @app.command("info")
+@with_storage_options
 def get_info(
     path: str = typer.Argument(
         ...,
         help="Path to get info for",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Get information about file in storage
     """
     logger.debug(
         "Getting info for %s using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style
-        )
-
-        exists = storage.exists(path)
-        if not exists:
-            typer.echo(f"File {path} does not exist")
-            raise typer.Exit(1)
+        storage = opts.create()
 
         # Get file info
-        if isinstance(storage, ObjectStorage):
-            # For object storage, get object stats
-            stat = storage.client.stat_object(storage.bucket, path)
+        if opts.storage_type is StorageType.OBJECT:
+            # For object storage, a single HEAD both checks existence
+            # and returns the object stats
+            stat = storage.stat(path)
+            if stat is None:
+                typer.echo(f"File {path} does not exist")
+                raise typer.Exit(1)
             typer.echo(f"File: {path}")
             typer.echo(f"Size: {stat.size} bytes")
             typer.echo(f"Last Modified: {stat.last_modified}")
             typer.echo(f"ETag: {stat.etag}")
             typer.echo(f"Content Type: {stat.content_type}")
         else:
-            # For file storage, get file stats
+            # For file storage, get file stats; a missing file is
+            # reported by the stat call itself
             full_path = storage.full_path(path)
-            import os
-            stat = os.stat(full_path)
+            try:
+                stat = os.stat(full_path)
+            except FileNotFoundError:
+                typer.echo(f"File {path} does not exist")
+                raise typer.Exit(1)
             typer.echo(f"File: {path}")
             typer.echo(f"Size: {stat.st_size} bytes")
             typer.echo(f"Last Modified: {stat.st_mtime}")
             typer.echo(f"Full Path: {full_path}")
 
+    except typer.Exit:
+        raise
     except Exception as e:
         logger.error(
             "Failed to get file info: %s",
@@ -647,6 +1021,7 @@ def get_info(
 
 
 @app.command("list")
+@with_storage_options
 def list_files(
     path: str = typer.Argument(
         "",
@@ -657,61 +1032,24 @@ def list_files(
         "-p", "--pattern",
         help="File pattern to match",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     List files in storage
     """
     logger.debug(
         "Listing files in %s with pattern %s using %s storage",
-        path, pattern, storage_type
+        path, pattern, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style, path
-        )
-        files = storage.ls(path, pattern)
-        if files:
-            for file in files:
-                typer.echo(file)
-        else:
+        storage = opts.create(path)
+        # Print files as the listing streams in
+        found = False
+        for file in storage.iter_ls(path, pattern):
+            found = True
+            typer.echo(file)
+        if not found:
             typer.echo("No files found")
     except Exception as e:
         logger.error(
@@ -724,6 +1062,7 @@ def list_files(
 
 
 @app.command("delete")
+@with_storage_options
 def delete(
     path: str = typer.Argument(
         ...,
@@ -734,56 +1073,18 @@ def delete(
         "-r", "--recursive",
         help="Recursively delete directory",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Delete a file or directory from storage
     """
     logger.debug(
         "Deleting %s (recursive=%s) using %s storage",
-        path, recursive, storage_type
+        path, recursive, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style, path
-        )
+        storage = opts.create(path)
         storage.rm(path, recursive)
         typer.echo(f"Successfully deleted {path}")
     except Exception as e:
@@ -796,62 +1097,67 @@ def delete(
         raise typer.Exit(1)
 
 
+@app.command("delete-many")
+@with_storage_options
+def delete_many(
+    prefix: Optional[str] = typer.Option(
+        None,
+        "-p", "--prefix",
+        help=(
+            "Delete everything under this prefix (otherwise paths are "
+            "read from standard input, one per line)"
+        ),
+    ),
+    opts: StorageOptions = None,
+):
+    """
+    Delete many files, in batches for object storage
+    """
+    logger.debug(
+        "Deleting %s using %s storage",
+        f"prefix {prefix}" if prefix else "paths from stdin",
+        opts.storage_type
+    )
+
+    try:
+        storage = opts.create()
+        if prefix:
+            storage.rm(prefix, recursive=True)
+            typer.echo(f"Successfully deleted everything under {prefix}")
+        else:
+            # Paths are streamed into the delete batches as they are read
+            paths = (line.strip() for line in sys.stdin)
+            removed = storage.rm_many(path for path in paths if path)
+            typer.echo(f"Successfully deleted {removed} files")
+    except Exception as e:
+        logger.error(
+            "Failed to delete: %s",
+            str(e),
+            exc_info=True
+        )
+        typer.echo(f"Failed to delete: {str(e)}")
+        raise typer.Exit(1)
+
+
 @app.command("exists")
+@with_storage_options
 def exists(
     path: str = typer.Argument(
         ...,
         help="Path to check",
     ),
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Check if a file exists in storage
     """
     logger.debug(
         "Checking if %s exists using %s storage",
-        path, storage_type
+        path, opts.storage_type
     )
 
     try:
-        storage = _get_storage(
-            storage_type, bucket, endpoint, access_key, secret_key,
-            region, use_virtual_style, path
-        )
+        storage = opts.create(path)
         if storage.exists(path):
             typer.echo(f"{path} exists")
         else:
@@ -867,71 +1173,33 @@ def exists(
 
 
 @app.command("temp-dir")
+@with_storage_options
 def get_temp_dir(
-    storage_type: str = typer.Option(
-        "file",
-        "-t", "--type",
-        help="Storage type (file or object)",
-        case_sensitive=False,
-    ),
-    bucket: Optional[str] = typer.Option(
-        None,
-        "-b", "--bucket",
-        help="Bucket name for object storage",
-    ),
-    endpoint: Optional[str] = typer.Option(
-        None,
-        "-e", "--endpoint",
-        help="Endpoint URL for object storage",
-    ),
-    access_key: Optional[str] = typer.Option(
-        None,
-        "-k", "--access-key",
-        help="Access key for object storage",
-    ),
-    secret_key: Optional[str] = typer.Option(
-        None,
-        "-s", "--secret-key",
-        help="Secret key for object storage",
-    ),
-    region: Optional[str] = typer.Option(
-        None,
-        "-r", "--region",
-        help="Region for object storage",
-    ),
-    use_virtual_style: bool = typer.Option(
-        False,
-        "-v", "--virtual-style",
-        help="Use virtual style endpoint for object storage",
-    ),
+    opts: StorageOptions = None,
 ):
     """
     Get temporary directory information for uploads and downloads
     """
     logger.debug(
         "Getting temp directory info using %s storage",
-        storage_type
+        opts.storage_type
     )
 
     try:
-        import tempfile
-        import os
+        import tempfile  # Lazy import to speed up CLI startup
 
         # Get system temp directory
         temp_dir = tempfile.gettempdir()
         typer.echo(f"System temporary directory: {temp_dir}")
 
-        if storage_type.lower() == "object":
+        if opts.storage_type is StorageType.OBJECT:
             # For object storage, show presigned URL info
-            if not all([bucket, endpoint, access_key, secret_key]):
+            if not opts.has_object_credentials():
                 typer.echo("Object storage credentials required for presigned URLs")
                 typer.echo("Use --bucket, --endpoint, --access-key, --secret-key options")
                 raise typer.Exit(1)
 
-            storage = _get_storage(
-                storage_type, bucket, endpoint, access_key, secret_key,
-                region, use_virtual_style
-            )
+            storage = opts.create()
 
             # Generate example presigned URLs
             example_path = "temp/example.txt"
@@ -6,8 +6,9 @@ from pathlib import Path
 import base64
 import hashlib
 import logging
-from typing import Optional, List
-from devtoolbox.webhook import Webhook
+import mmap
+import os
+from typing import List, Optional, Tuple
 from devtoolbox.cli.utils import setup_logging
 
 
@@ -16,6 +17,54 @@ logger = logging.getLogger("devtoolbox.webhook")
 app = typer.Typer(help="Webhook related commands")
 
 
+# Bytes read per step when encoding an image. A multiple of 3, so each
+# chunk encodes to whole base64 groups and the pieces can be joined.
+_IMAGE_CHUNK_SIZE = 3 * 21845
+
+
+def _encode_image(path: Path) -> Tuple[str, str, int]:
+    """Base64-encode and MD5-hash an image in a single pass.
+
+    The file is memory-mapped and processed in chunks that are hashed
+    and encoded while still in cache, so the raw image is never copied
+    into memory as a whole.
+    pybase64's SIMD codec is used when installed.
+
+    Args:
+        path: Image file
+
+    Returns:
+        Base64 content, MD5 hex digest and size in bytes
+    """
+    try:
+        from pybase64 import b64encode
+    except ImportError:
+        b64encode = base64.b64encode
+
+    # WeCom requires the MD5 of the image, so a faster hash cannot be
+    # used; it is only a checksum, which FIPS builds of OpenSSL allow
+    # once flagged as not used for security (Python 3.9+)
+    try:
+        md5 = hashlib.md5(usedforsecurity=False)
+    except TypeError:
+        md5 = hashlib.md5()
+    encoded = bytearray()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            # Empty files cannot be mapped
+            return "", md5.hexdigest(), 0
+        # Chunks are slices of the mapped file, so nothing is copied
+        # into Python buffers before hashing and encoding
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            for offset in range(0, size, _IMAGE_CHUNK_SIZE):
+                with view[offset:offset + _IMAGE_CHUNK_SIZE] as chunk:
+                    md5.update(chunk)
+                    encoded += b64encode(chunk)
+    return encoded.decode("ascii"), md5.hexdigest(), size
+
+
 @app.callback()
 def callback(
     debug: bool = typer.Option(
@@ -39,10 +88,13 @@ def send_text(
         "-u", "--url",
         help="Webhook URL to send message to",
     ),
-    content: str = typer.Option(
+    content: List[str] = typer.Option(
         ...,
         "-c", "--content",
-        help="Text content to send",
+        help=(
+            "Text content to send (can be used multiple times, each is "
+            "sent as a separate message over the same connection)"
+        ),
     ),
     mention: Optional[List[str]] = typer.Option(
         None,
@@ -62,14 +114,21 @@ def send_text(
         "Sending text message to %s: %s (mentions: %s, mobile: %s)",
         url, content, mention, mention_mobile
     )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.webhook import Webhook
+
     webhook = Webhook(url)
     try:
-        webhook.send_text_message(
-            content,
-            mentioned_list=mention,
-            mentioned_mobile_list=mention_mobile
-        )
-        typer.echo("Text message sent successfully")
+        for text in content:
+            webhook.send_text_message(
+                text,
+                mentioned_list=mention,
+                mentioned_mobile_list=mention_mobile
+            )
+        if len(content) == 1:
+            typer.echo("Text message sent successfully")
+        else:
+            typer.echo(f"{len(content)} text messages sent successfully")
     except Exception as e:
         logger.error(
             "Failed to send text message: %s",
@@ -87,10 +146,13 @@ def send_markdown(
         "-u", "--url",
         help="Webhook URL to send message to",
     ),
-    content: str = typer.Option(
+    content: List[str] = typer.Option(
         ...,
         "-c", "--content",
-        help="Markdown content to send",
+        help=(
+            "Markdown content to send (can be used multiple times, each "
+            "is sent as a separate message over the same connection)"
+        ),
     ),
 ):
     """
@@ -100,10 +162,19 @@ def send_markdown(
         "Sending markdown message to %s: %s",
         url, content
     )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.webhook import Webhook
+
     webhook = Webhook(url)
     try:
-        webhook.send_markdown_message(content)
-        typer.echo("Markdown message sent successfully")
+        for markdown in content:
+            webhook.send_markdown_message(markdown)
+        if len(content) == 1:
+            typer.echo("Markdown message sent successfully")
+        else:
+            typer.echo(
+                f"{len(content)} markdown messages sent successfully"
+            )
     except Exception as e:
         logger.error(
             "Failed to send markdown message: %s",
@@ -137,16 +208,13 @@ def send_image(
         "Sending image message to %s from file: %s",
         url, file
     )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.webhook import Webhook
+
     webhook = Webhook(url)
     try:
-        with open(file, "rb") as f:
-            image_data = f.read()
-            base64_data = base64.b64encode(image_data).decode("utf-8")
-            md5_hash = hashlib.md5(image_data).hexdigest()
-            logger.debug(
-                "Image processed: size=%d, md5=%s",
-                len(image_data), md5_hash
-            )
+        base64_data, md5_hash, size = _encode_image(file)
+        logger.debug("Image processed: size=%d, md5=%s", size, md5_hash)
 
         webhook.send_image_message(base64_data, md5_hash)
         typer.echo("Image message sent successfully")
@@ -167,21 +235,40 @@ def send_file(
         "-u", "--url",
         help="Webhook URL to send message to",
     ),
-    media_id: str = typer.Option(
-        ...,
+    media_id: Optional[str] = typer.Option(
+        None,
         "-i", "--media-id",
-        help="Media ID of the file to send",
+        help="Media ID of an already uploaded file to send",
+    ),
+    file: Optional[Path] = typer.Option(
+        None,
+        "-f", "--file",
+        help=(
+            "Upload this file and send it (sent as binary, without "
+            "the base64 encoding image messages need)"
+        ),
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
     ),
 ):
     """
     Send a file message via webhook
     """
+    if (media_id is None) == (file is None):
+        typer.echo("Specify exactly one of --media-id or --file")
+        raise typer.Exit(1)
     logger.debug(
-        "Sending file message to %s with media_id: %s",
-        url, media_id
+        "Sending file message to %s with media_id: %s, file: %s",
+        url, media_id, file
     )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.webhook import Webhook
+
     webhook = Webhook(url)
     try:
+        if file is not None:
+            media_id = webhook.upload_media(str(file))
         webhook.send_file_message(media_id)
         typer.echo("File message sent successfully")
     except Exception as e:
@@ -219,6 +306,9 @@ def send_feishu_card(
         "Sending Feishu card message to %s: title=%s, color=%s, wide_screen=%s",
         url, title, template_color, wide_screen
     )
+    # Lazy import to speed up CLI startup
+    from devtoolbox.webhook import Webhook
+
     webhook = Webhook(url)
     try:
         webhook.send_feishu_card_message(
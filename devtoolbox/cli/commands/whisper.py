@@ -1,9 +1,34 @@
+import hashlib
+import os
+
 import typer
 import logging
 from devtoolbox.cli.utils import setup_logging
 
 app = typer.Typer(help="Whisper model management commands")
 
+# Read size used when verifying the checksum of a cached model file
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def _model_cache_root() -> str:
+    """Return the directory Whisper uses to cache downloaded models."""
+    default = os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(os.getenv("XDG_CACHE_HOME", default), "whisper")
+
+
+def _is_cached(path: str, expected_sha256: str) -> bool:
+    """Check whether a model file exists and matches its checksum."""
+    if not os.path.isfile(path):
+        return False
+
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest() == expected_sha256
+
+
 @app.command()
 def download(
     model_size: str = typer.Option(
@@ -22,9 +47,31 @@ def download(
 
     try:
         import whisper  # Lazy import to speed up CLI startup
-        logger.info(f"Downloading Whisper {model_size} model...")
-        whisper.load_model(model_size)
-        logger.info(f"Successfully downloaded Whisper {model_size} model")
+
+        if model_size not in whisper._MODELS:
+            logger.error(
+                "Unknown Whisper model: %s. Available models: %s",
+                model_size, whisper.available_models()
+            )
+            raise typer.Exit(1)
+
+        # The SHA-256 of each checkpoint is embedded in its URL
+        url = whisper._MODELS[model_size]
+        root = _model_cache_root()
+        target = os.path.join(root, os.path.basename(url))
+        if _is_cached(target, url.split("/")[-2]):
+            logger.info(
+                "Whisper %s model already cached at %s", model_size, target
+            )
+            return
+
+        # Only fetch the checkpoint to disk; load_model() would also
+        # allocate the full model in memory, which is not needed here
+        logger.info("Downloading Whisper %s model...", model_size)
+        whisper._download(url, root, False)
+        logger.info("Successfully downloaded Whisper %s model", model_size)
+    except typer.Exit:
+        raise
     except Exception as e:
-        logger.error(f"Failed to download Whisper model: {str(e)}")
-        raise typer.Exit(1)
\ No newline at end of file
+        logger.error("Failed to download Whisper model: %s", str(e))
+        raise typer.Exit(1)
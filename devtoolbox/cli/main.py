@@ -1,68 +1,88 @@
 """
 Main CLI entry point for devtoolbox
 """
+import importlib
+
 import typer
+from typer.core import TyperGroup
+
+# Subcommands as name -> (module, help). Each module is only imported
+# when its subcommand runs, so a command never pays for the imports (or
+# missing optional dependencies) of the others.
+SUBCOMMANDS = {
+    "webhook": (
+        "devtoolbox.cli.commands.webhook", "Webhook related commands"
+    ),
+    "storage": (
+        "devtoolbox.cli.commands.storage", "Storage related commands"
+    ),
+    "jira": ("devtoolbox.cli.commands.jira", "JIRA related commands"),
+    "speech": ("devtoolbox.cli.commands.speech", "Speech related commands"),
+    "whisper": (
+        "devtoolbox.cli.commands.whisper",
+        "Whisper model management commands"
+    ),
+    "search": (
+        "devtoolbox.cli.commands.search", "Search engine related commands"
+    ),
+    "images": ("devtoolbox.cli.commands.images", "Image processing commands"),
+    "markdown": (
+        "devtoolbox.cli.commands.markdown", "Markdown processing commands"
+    ),
+    "llm": ("devtoolbox.cli.commands.llm", "LLM commands"),
+    "ocr": ("devtoolbox.cli.commands.ocr", "OCR related commands"),
+    "github": ("devtoolbox.cli.commands.github", "GitHub related commands"),
+}
+
+
+class LazySubcommand(TyperGroup):
+    """Placeholder for a subcommand group whose module is not loaded yet.
+
+    It only carries what the top-level help shows. The module is
+    imported, and the real group built, when the subcommand is invoked.
+    """
+
+    def __init__(self, name: str, module_name: str, help: str):
+        super().__init__(name=name, help=help)
+        self.module_name = module_name
+
+    def load(self) -> TyperGroup:
+        """Import the subcommand module and build its command group."""
+        module = importlib.import_module(self.module_name)
+        # Register it the same way as a regular add_typer so commands
+        # and help behave exactly as if it had been added eagerly
+        parent = typer.Typer()
+        parent.add_typer(module.app, name=self.name, help=self.help)
+        return typer.main.get_command(parent).commands[self.name]
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        return self.load().make_context(
+            info_name, args, parent=parent, **extra
+        )
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group listing the subcommands without importing them."""
+
+    def __init__(self, **attrs):
+        super().__init__(**attrs)
+        for name, (module_name, help_text) in SUBCOMMANDS.items():
+            self.add_command(LazySubcommand(name, module_name, help_text))
 
-# Import and register subcommands
-from devtoolbox.cli.commands import (
-    webhook, storage, jira, speech, whisper, search, images, markdown, llm,
-    ocr, github
-)
 
 app = typer.Typer(
     name="devtoolbox",
     help="A collection of development tools and utilities",
     add_completion=False,
+    cls=LazyGroup,
 )
 
-# Register webhook commands
-app.add_typer(webhook.app, name="webhook", help="Webhook related commands")
-
-# Register storage commands
-app.add_typer(storage.app, name="storage", help="Storage related commands")
-
-# Register jira commands
-app.add_typer(jira.app, name="jira", help="JIRA related commands")
-
-# Register speech commands
-app.add_typer(speech.app, name="speech", help="Speech related commands")
-
-# Register whisper commands
-app.add_typer(
-    whisper.app,
-    name="whisper",
-    help="Whisper model management commands"
-)
-
-# Register search commands
-app.add_typer(
-    search.app,
-    name="search",
-    help="Search engine related commands"
-)
-
-# Register images commands
-app.add_typer(
-    images.app,
-    name="images",
-    help="Image processing commands"
-)
-
-# Register markdown commands
-app.add_typer(
-    markdown.app,
-    name="markdown",
-    help="Markdown processing commands"
-)
-
-# Register llm commands
-app.add_typer(llm.app, name="llm")
-
-# Register ocr commands
-app.add_typer(ocr.app, name="ocr", help="OCR related commands")
 
-# Register github commands
-app.add_typer(github.app, name="github", help="GitHub related commands")
+@app.callback()
+def callback():
+    """
+    A collection of development tools and utilities
+    """
 
 
 def main():
@@ -71,4 +91,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,22 +1,33 @@
 # devtoolbox/setup_nlp.py
-import subprocess
-import sys
 
 # Define supported languages
 LANGS = ['en', 'zh']
 
+
+def _download(spacy_download, model):
+    """Download a single spaCy model."""
+    try:
+        print(f"Downloading {model}...")
+        spacy_download(model, False, False, "--quiet")
+        print(f"Successfully downloaded {model}")
+    except (Exception, SystemExit) as e:
+        # spaCy reports download failures by exiting
+        print(f"Error downloading {model}: {e}")
+
+
 def download_spacy_models():
     """Download required spaCy models."""
+    # spaCy is imported once here rather than by a new interpreter per
+    # model running "python -m spacy download"
+    from spacy.cli.download import download as spacy_download
+
     models = [f"{lang}_core_{'web' if lang in ['en', 'zh'] else 'news'}_sm"
              for lang in LANGS]
 
+    # One at a time: each download runs pip install, and concurrent pip
+    # installs into the same environment are not supported
     for model in models:
-        try:
-            print(f"Downloading {model}...")
-            subprocess.check_call([sys.executable, '-m', 'spacy', 'download', model])
-            print(f"Successfully downloaded {model}")
-        except Exception as e:
-            print(f"Error downloading {model}: {e}")
+        _download(spacy_download, model)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
 """
 Common utilities for CLI commands
 """
+import hashlib
 import logging
+from pathlib import Path
 from typing import Optional
 
+# Read size used when hashing files without hashlib.file_digest
+_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 def setup_logging(
     debug: bool = False,
@@ -27,6 +32,14 @@ def setup_logging(
     if log_format is None:
         log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Skip the thread and process lookups done for every log record
+    # unless the format shows them
+    if "%(thread" not in log_format:
+        logging.logThreads = False
+    if "%(process" not in log_format:
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
     # Configure logging
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
@@ -41,4 +54,37 @@ def setup_logging(
     if debug:
         logger.debug("Debug mode enabled for %s", logger_name)
 
-    return logger
\ No newline at end of file
+    return logger
+
+
+def content_hash(path: Path) -> str:
+    """
+    Hash the content of a file for cache keys and deduplication
+
+    BLAKE3 is used when the optional blake3 package is installed; it
+    hashes large files with SIMD across several threads. Otherwise the
+    file is hashed with SHA-256, through OpenSSL's file_digest where
+    available, in blocks so large files are never loaded at once.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest, prefixed with the algorithm when it is not SHA-256
+    """
+    try:
+        import blake3
+    except ImportError:
+        blake3 = None
+    if blake3 is not None:
+        hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        hasher.update_mmap(str(path))
+        return "blake3-" + hasher.hexdigest()
+
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+        return digest.hexdigest()
@@ -1,14 +1,16 @@
 import base64
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
 import logging
 from io import BytesIO
 import os
 import tempfile
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-import cairosvg
 import imagehash
 import requests
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, ImageFile, UnidentifiedImageError
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -43,8 +45,151 @@ CONVERT_IMAGE_MAX_WIDTH = 1280
 # Maximum number of trending images to retrieve
 MAX_TRENDINGS_NUM = 25
 
-# Number of worker threads for collecting images
-COLLECTOR_WORKERS = 2
+# Number of worker threads for collecting images; downloads wait on
+# the network, so many more threads than cores pay off
+COLLECTOR_WORKERS = 16
+
+# Smallest size images are decoded at for duplicate detection
+HASH_DRAFT_SIZE = 64
+
+# Largest download accepted, in bytes
+MAX_DOWNLOAD_BYTES = 50 * 1024 * 1024
+
+# Largest image accepted, in pixels; bigger ones (such as decompression
+# bombs) are rejected from their header, before any pixel is decoded
+MAX_IMAGE_PIXELS = 40_000_000
+
+# Largest number of differing dhash bits for two images to be taken as
+# duplicates, such as the same picture recompressed or watermarked
+DUPLICATE_HASH_DISTANCE = 5
+
+# File extension of each format downloaded images are saved in
+OUTPUT_EXTENSIONS = {"jpeg": "jpg", "png": "png"}
+
+# Query parameters that only track clicks and never change the image
+TRACKING_QUERY_PARAMS = ("fbclid", "gclid")
+TRACKING_QUERY_PREFIX = "utm_"
+
+# Size of the blocks image downloads are read in
+DOWNLOAD_CHUNK_SIZE = 16 * 1024
+
+# Bytes of a download searched for the image header; dimensions are
+# checked there so rejected images are not downloaded in full
+HEADER_SNIFF_LIMIT = 256 * 1024
+
+
+def _normalize_url(url):
+    """Normalize an image URL for finding duplicate URLs.
+
+    The scheme and host are lowercased, and the fragment and tracking
+    query parameters are dropped. data: URLs are returned unchanged.
+    """
+    if url.startswith("data:"):
+        return url
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.startswith(TRACKING_QUERY_PREFIX) and
+        key not in TRACKING_QUERY_PARAMS
+    ]
+    return urlunsplit((
+        parts.scheme.lower(), parts.netloc.lower(), parts.path,
+        urlencode(query), ""
+    ))
+
+
+def _unique_urls(urls):
+    """Drop URLs that normalize to an earlier one, keeping the order."""
+    seen = set()
+    unique = []
+    for url in urls:
+        key = _normalize_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
+
+
+def _draft_for_hash(image_obj):
+    """Have JPEGs decode in grayscale at a fraction of their size.
+
+    Once loaded, the image is only used for its hash, which shrinks it
+    to 9x8 pixels anyway, so a decode at up to 1/8 scale is enough.
+    It is a no-op for other formats. The image size changes, so read
+    it before calling this.
+    """
+    image_obj.draft("L", (HASH_DRAFT_SIZE, HASH_DRAFT_SIZE))
+
+
+def _dhash(image_obj):
+    """Difference hash of an image as a 64-bit integer.
+
+    Integers are compared and hashed natively, so duplicates are found
+    with a set lookup instead of comparing ImageHash arrays one by one.
+    """
+    return int(str(imagehash.dhash(image_obj)), 16)
+
+
+def _hamming(hash_a, hash_b):
+    """Number of differing bits between two image hashes."""
+    return bin(hash_a ^ hash_b).count("1")
+
+
+class _HashTree:
+    """BK-tree of image hashes, for finding near duplicates.
+
+    Each node keeps its children by their distance to it. By the
+    triangle inequality, a search only descends into children whose
+    distance is within max_distance of the query's distance to the
+    node, instead of comparing the query with every hash.
+    """
+
+    def __init__(self):
+        self._root = None
+
+    def add(self, image_hash):
+        """Store a hash; hashes already stored are ignored."""
+        if self._root is None:
+            self._root = (image_hash, {})
+            return
+        node_hash, children = self._root
+        while True:
+            distance = _hamming(image_hash, node_hash)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = (image_hash, {})
+                return
+            node_hash, children = child
+
+    def has_near(self, image_hash, max_distance):
+        """Whether a stored hash is within max_distance bits of a hash."""
+        nodes = [self._root] if self._root is not None else []
+        while nodes:
+            node_hash, children = nodes.pop()
+            distance = _hamming(image_hash, node_hash)
+            if distance <= max_distance:
+                return True
+            nodes.extend(
+                child for child_distance, child in children.items()
+                if abs(child_distance - distance) <= max_distance
+            )
+        return False
+
+
+def _pick_encoding(image_obj):
+    """Format to save a downloaded image in, from its header.
+
+    Opaque photos are saved as JPEG, which encodes several times faster
+    than PNG and into much smaller files. Images with transparency, and
+    palette images, mostly drawings and screenshots, are saved as PNG.
+    """
+    if (image_obj.mode in ("RGB", "L", "CMYK", "YCbCr") and
+            "transparency" not in image_obj.info):
+        return "jpeg"
+    return "png"
 
 
 class ImageDownloader:
@@ -65,7 +210,8 @@ class ImageDownloader:
         remove_duplicate=True,
         enable_search_download=False,
         search_keywords=None,
-        compress=True
+        compress=True,
+        workers=COLLECTOR_WORKERS
     ):
         """Initialize the ImageDownloader with the specified parameters.
 
@@ -85,7 +231,8 @@ class ImageDownloader:
             images (list): List of image URLs to download.
             path_prefix (str): Directory path where images will be saved.
             base_filename (str): Base name for saved image files. Each downloaded
-                image will be named as "{base_filename}-{index}.png".
+                image will be named as "{base_filename}-{index}.jpg", or
+                "{base_filename}-{index}.png" if it has transparency.
             storage (Storage, optional): Storage object used to save downloaded images.
                 If None, a default file system storage will be used or the class will
                 operate in memory-only mode. Defaults to None.
@@ -118,6 +265,9 @@ class ImageDownloader:
                 Defaults to None.
             compress (bool, optional): Whether to compress images after resizing.
                 Defaults to True.
+            workers (int, optional): Number of threads downloading images in
+                parallel. Defaults to COLLECTOR_WORKERS (16). Pass 1 to
+                download images one at a time.
 
         Note:
             The class uses image hashing to detect and filter duplicate images,
@@ -154,9 +304,34 @@ class ImageDownloader:
 
         self.enable_search_download = enable_search_download
         self.search_keywords = search_keywords
+        self.workers = max(1, workers)
+        # dhash of downloaded content by its digest, so the same image
+        # served under several URLs is decoded and hashed once
+        self._hash_cache = {}
+
+        # Shared by all download threads, keeping a pooled keep-alive
+        # connection per thread and host; retries are done by tenacity
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.workers,
+            pool_maxsize=self.workers,
+            max_retries=0
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         self._validate_configuration()
 
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _validate_configuration(self):
         """Validate the configuration and set up any defaults needed.
 
@@ -172,47 +347,171 @@ class ImageDownloader:
 
         full_path_prefix = self.storage.full_path(self.path_prefix)
         if not os.path.exists(full_path_prefix):
-            logging.info(f"Creating directory: {full_path_prefix}")
+            logging.info("Creating directory: %s", full_path_prefix)
             os.makedirs(full_path_prefix, exist_ok=True)
 
-    def _parallel_download_images(self, all_images):
+    def _parallel_download_images(self, all_images, search_future=None):
         """Download image in parallel model
 
+        Args:
+            all_images (list): URLs of the images to download.
+            search_future (Future, optional): Search for more image URLs
+                still running. Its URLs are downloaded as soon as it
+                completes, ranked after all_images.
+
         Return a dict with image_url => image_hash
         """
         results = {}
-        with ThreadPoolExecutor(max_workers=COLLECTOR_WORKERS) as executor:
-            futures = []
-            article_images = all_images
-            for idx, url in enumerate(article_images):
-                future = executor.submit(self._download_image, idx, url)
-                futures.append(future)
-
-        filter_images_hashes = []
-        for future in as_completed(futures):
-            result = future.result()
-
-            # Skip to empty image
-            if not result["content"]:
-                continue
-
-            image_url = result["image_url"]
-            image_hash = result["hash"]
-
-            # NOTE(Ray): Use image hash to remove duplicate images, dhash
-            # can remove duplicate images with different size and colors
-            if image_hash in filter_images_hashes:
-                logging.warn("Duplicate image found, skip to "
-                             "download image from %s" % image_url)
-                continue
-            else:
-                logging.debug("Add image hash %s" % image_hash)
-                filter_images_hashes.append(image_hash)
+        filter_images_hashes = _HashTree()
+        all_images = _unique_urls(all_images)
+        if search_future is None:
+            max_workers = max(1, min(self.workers, len(all_images)))
+        else:
+            max_workers = self.workers
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._download_image, idx, url)
+                for idx, url in enumerate(all_images)
+            ]
+            logging.info("Trying to filter (%d) images", len(all_images))
+            logging.debug("All Images: %s", all_images)
+
+            if search_future is not None:
+                # The known images download while waiting for the search
+                search_images = _unique_urls(
+                    all_images + search_future.result()
+                )[len(all_images):]
+                futures.extend(
+                    executor.submit(self._download_image, idx, url)
+                    for idx, url in enumerate(
+                        search_images, start=len(all_images)
+                    )
+                )
+                logging.info(
+                    "Trying to filter (%d) more images from search",
+                    len(search_images)
+                )
+                logging.debug("Search Images: %s", search_images)
+
+            # Handle each image as soon as it is downloaded, while the
+            # others are still in flight
+            for future in as_completed(futures):
+                result = future.result()
+
+                # Skip to empty image
+                if not result["content"]:
+                    continue
 
-            results[image_url] = result
+                image_url = result["image_url"]
+                image_hash = result["hash"]
+
+                # NOTE(Ray): Use image hash to remove duplicate images,
+                # dhash can remove duplicate images with different size
+                # and colors. Hashes a few bits apart are duplicates too.
+                if filter_images_hashes.has_near(
+                        image_hash, DUPLICATE_HASH_DISTANCE):
+                    logging.warn("Duplicate image found, skip to "
+                                 "download image from %s", image_url)
+                    continue
+                else:
+                    logging.debug("Add image hash %016x", image_hash)
+                    filter_images_hashes.add(image_hash)
+
+                results[image_url] = result
 
         return results
 
+    def _check_size(self, width, height):
+        """Check image dimensions against the filters.
+
+        Returns:
+            tuple: Whether the size and the aspect ratio are valid.
+        """
+        aspect_ratio = width / height
+        is_size_valid = (
+            width >= self.filter_width and
+            height >= self.filter_height
+        )
+        is_aspect_ratio_valid = (
+            aspect_ratio > ASPECT_RATIO_RANGE[0] and
+            aspect_ratio < ASPECT_RATIO_RANGE[1]
+        )
+        return is_size_valid, is_aspect_ratio_valid
+
+    def _fetch_image(self, image_url):
+        """Download an image, stopping early if it cannot pass the filters.
+
+        The body is streamed and its image header parsed as it arrives,
+        so images whose dimensions fail the filters are dropped after
+        their first blocks instead of being downloaded in full.
+
+        Args:
+            image_url (str): URL of the image to download.
+
+        Returns:
+            bytes: Image content, or None if the image was rejected.
+        """
+        with self._session.get(
+            image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT, stream=True
+        ) as response:
+            # Check content type
+            content_type = response.headers.get('content-type', '')
+            if not content_type.startswith('image/'):
+                logging.warning(
+                    "Invalid content type for %s: %s",
+                    image_url, content_type
+                )
+                return None
+
+            content_length = int(response.headers.get('content-length', 0))
+            if content_length > MAX_DOWNLOAD_BYTES:
+                logging.warning(
+                    "Ignore image %s due to its size of %d bytes",
+                    image_url, content_length
+                )
+                return None
+
+            # SVGs are only sized once rasterized, and the top image is
+            # kept whatever its size
+            sniff = (
+                not image_url.endswith('.svg') and
+                image_url != self.top_image
+            )
+            parser = ImageFile.Parser()
+            chunks = []
+            received = 0
+            for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                chunks.append(chunk)
+                received += len(chunk)
+                if received > MAX_DOWNLOAD_BYTES:
+                    logging.warning(
+                        "Ignore image %s, larger than %d bytes",
+                        image_url, MAX_DOWNLOAD_BYTES
+                    )
+                    return None
+                if not sniff:
+                    continue
+                try:
+                    parser.feed(chunk)
+                except Exception:
+                    # Left for the full validation after download
+                    sniff = False
+                    continue
+                if parser.image is not None:
+                    sniff = False
+                    width, height = parser.image.size
+                    if (width * height > MAX_IMAGE_PIXELS or
+                            not all(self._check_size(width, height))):
+                        logging.warning(
+                            "Ignore image %s due to its size %dx%d, "
+                            "stopped after %d bytes",
+                            image_url, width, height, received
+                        )
+                        return None
+                elif received >= HEADER_SNIFF_LIMIT:
+                    sniff = False
+            return b"".join(chunks)
+
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -238,132 +537,189 @@ class ImageDownloader:
             "index": idx,
             "image_url": image_url,
             "content": None,
-            "hash": None
+            "hash": None,
+            "output_format": None
         }
 
         try:
-            logging.info(f"Downloading image from {image_url}")
+            logging.info("Downloading image from %s", image_url)
 
             save_content = None
             if image_url.startswith('data:image/'):
                 image_data = image_url.split(',')[-1]
                 save_content = base64.b64decode(image_data)
             else:
-                response = requests.get(
-                    image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT)
-                # Check content type
-                content_type = response.headers.get('content-type', '')
-                if not content_type.startswith('image/'):
-                    logging.warning(
-                        f"Invalid content type for {image_url}: {content_type}"
-                    )
+                save_content = self._fetch_image(image_url)
+                if save_content is None:
                     return image_infos
-                save_content = response.content
 
             if image_url.endswith('.svg'):
+                # Only needed for SVGs, and needs the cairo library
+                import cairosvg
                 save_content = cairosvg.svg2png(bytestring=save_content)
 
-            # Verify image content
+            # Only the header is read here; pixel data is decoded once
+            # the image has passed the filters
             try:
                 image_obj = Image.open(BytesIO(save_content))
-                # Try to load the image to verify it's valid
-                image_obj.load()
             except Exception as e:
                 logging.warning(
-                    f"Invalid image content from {image_url}: {str(e)}"
+                    "Invalid image content from %s: %s", image_url, e
                 )
                 return image_infos
 
+            # Picked from the header, before drafting changes the mode
+            output_format = _pick_encoding(image_obj)
             width, height = image_obj.size
-            aspect_ratio = width / height
+            if width * height > MAX_IMAGE_PIXELS:
+                logging.warning(
+                    "Ignore image %s due to its size %dx%d, more than %d "
+                    "pixels", image_url, width, height, MAX_IMAGE_PIXELS
+                )
+                return image_infos
 
             # Output original image information
             logging.info(
-                "Original image size: %dx%d (%.2f MB)" % (
-                    width,
-                    height,
-                    len(save_content) / (1024 * 1024)
-                )
+                "Original image size: %dx%d (%.2f MB)",
+                width,
+                height,
+                len(save_content) / (1024 * 1024)
             )
 
-            image_infos["hash"] = imagehash.dhash(image_obj)
-
             # if image is top image, we still put it in filter images
             # to ensure we can have a image
-            if image_url == self.top_image:
-                logging.info("Filtered top image by default %s" % image_url)
-                image_infos["content"] = save_content
-                return image_infos
-
-            is_size_valid = (
-                width >= self.filter_width and
-                height >= self.filter_height
-            )
-            is_aspect_ratio_valid = (
-                aspect_ratio > ASPECT_RATIO_RANGE[0] and
-                aspect_ratio < ASPECT_RATIO_RANGE[1]
+            is_top_image = image_url == self.top_image
+            is_size_valid, is_aspect_ratio_valid = self._check_size(
+                width, height
             )
+            if not is_top_image and not (
+                    is_size_valid and is_aspect_ratio_valid):
+                logging.warning(
+                    "Ignore image %s due to valid size: %s, "
+                    "invalid aspect ratio: %s",
+                    image_url, is_size_valid, not is_aspect_ratio_valid
+                )
+                return image_infos
 
-            if is_size_valid and is_aspect_ratio_valid:
-                logging.info("Success to filter image %s" % image_url)
-                image_infos["content"] = save_content
-
-                # Output resized image information
-                if self.convert_width and width > self.convert_width:
-                    new_height = int(height * (self.convert_width / width))
-                    logging.info(
-                        "Image will be resized to: %dx%d" % (
-                            self.convert_width,
-                            new_height
-                        )
+            content_key = hashlib.blake2b(
+                save_content, digest_size=16
+            ).digest()
+            image_hash = self._hash_cache.get(content_key)
+            if image_hash is None:
+                # Verify image content
+                try:
+                    _draft_for_hash(image_obj)
+                    # Try to load the image to verify it's valid
+                    image_obj.load()
+                except Exception as e:
+                    logging.warning(
+                        "Invalid image content from %s: %s", image_url, e
                     )
-            else:
-                logging.warning(
-                    f"Ignore image {image_url} due to valid size: "
-                    f"{is_size_valid}, invalid aspect ratio: "
-                    f"{not is_aspect_ratio_valid}"
+                    return image_infos
+                image_hash = _dhash(image_obj)
+                self._hash_cache[content_key] = image_hash
+
+            image_infos["hash"] = image_hash
+            image_infos["content"] = save_content
+            image_infos["output_format"] = output_format
+
+            if is_top_image:
+                logging.info("Filtered top image by default %s", image_url)
+                return image_infos
+
+            logging.info("Success to filter image %s", image_url)
+
+            # Output resized image information
+            if self.convert_width and width > self.convert_width:
+                new_height = int(height * (self.convert_width / width))
+                logging.info(
+                    "Image will be resized to: %dx%d",
+                    self.convert_width,
+                    new_height
                 )
 
         except UnidentifiedImageError:
             logging.warning(
-                f"Failed to download image from {image_url}, "
-                f"due to invalid image format"
+                "Failed to download image from %s, "
+                "due to invalid image format", image_url
             )
             raise
         except requests.exceptions.Timeout:
-            logging.warning(f"Timeout downloading image from {image_url}")
+            logging.warning("Timeout downloading image from %s", image_url)
             raise
         except requests.exceptions.RequestException as e:
             logging.warning(
-                f"Network error downloading image from {image_url}: "
-                f"{str(e)}"
+                "Network error downloading image from %s: %s", image_url, e
             )
             raise
         except Exception as e:
             logging.warning(
-                f"Failed to download image from {image_url}, "
-                f"due to: {str(e)}"
+                "Failed to download image from %s, due to: %s", image_url, e
             )
             raise
 
         return image_infos
 
+    def _image_path(self, idx, output_format):
+        """Storage path of the image saved at a position in a format."""
+        return os.path.join(
+            self.path_prefix, "%s-%s.%s" % (
+                self.base_filename, idx, OUTPUT_EXTENSIONS[output_format]
+            )
+        )
+
+    def _cached_images(self):
+        """Paths of the images saved by an earlier run, if all are there.
+
+        Images are saved as "{base_filename}-{n}.jpg" or ".png" by
+        position, and existing files are kept when use_cache is set. So
+        once every position up to max_download_num is saved,
+        downloading again cannot change the result.
+
+        Returns:
+            list: Full paths of the saved images, or None if any is
+                missing.
+        """
+        image_full_paths = []
+        for idx in range(self.max_download_num):
+            for output_format in OUTPUT_EXTENSIONS:
+                image_full_path = self.storage.full_path(
+                    self._image_path(idx, output_format)
+                )
+                if self.storage.exists(image_full_path):
+                    image_full_paths.append(image_full_path)
+                    break
+            else:
+                return None
+        return image_full_paths
+
     def download_images(self):
         logging.debug("Download images in parallel model...")
 
+        if self.use_cache:
+            cached_images = self._cached_images()
+            if cached_images is not None:
+                logging.info(
+                    "All %d images already exist in %s",
+                    len(cached_images), self.path_prefix
+                )
+                return cached_images
+
         # NOTE(Ray): If search images is enabled, added search images into
-        # download image list
-        all_images = list(self.images)
-        if self.enable_search_download:
-            search_engine = DuckDuckGoImageSearch(
-                self.search_keywords, max_results=MAX_DOWNLOAD_IMAGE_NUM)
-            search_images = search_engine.search_image_urls()
-            all_images.extend(search_images)
-
-        logging.info(f"Trying to filter ({len(all_images)}) images")
-        logging.debug(f"All Images: {all_images}")
-        filter_images = self._parallel_download_images(all_images)
-        logging.info(f"Get ({len(filter_images)}) filtered images")
+        # download image list. The search runs while the known images
+        # are downloaded.
+        with ThreadPoolExecutor(max_workers=1) as search_executor:
+            search_future = None
+            if self.enable_search_download:
+                search_engine = DuckDuckGoImageSearch(
+                    self.search_keywords, max_results=MAX_DOWNLOAD_IMAGE_NUM)
+                search_future = search_executor.submit(
+                    search_engine.search_image_urls
+                )
+            filter_images = self._parallel_download_images(
+                list(self.images), search_future
+            )
+        logging.info("Get (%d) filtered images", len(filter_images))
 
         sorted_images = sorted(
             filter_images.values(), key=lambda x: x["index"])
@@ -374,41 +730,48 @@ class ImageDownloader:
         collect_images = []
         save_index = 0
         for idx, collect_image in enumerate(filtered_images):
-            image_filename = "%s-%s.png" % (
-                self.base_filename, save_index)
-            image_path = os.path.join(self.path_prefix, image_filename)
+            output_format = collect_image["output_format"]
+            image_path = self._image_path(save_index, output_format)
             image_full_path = self.storage.full_path(image_path)
 
             image_url = collect_image["image_url"]
             save_content = collect_image["content"]
-            logging.info("Downloading image from %s to %s" % (
-                image_url, image_full_path))
+            logging.info(
+                "Downloading image from %s to %s", image_url, image_full_path)
 
             if self.storage.exists(image_full_path) and self.use_cache:
-                logging.info("Image already exists in %s" % image_full_path)
+                logging.info("Image already exists in %s", image_full_path)
             else:
-                logging.info("Writing image to path %s" % image_full_path)
+                logging.info("Writing image to path %s", image_full_path)
 
-                image_converter = ImageConverter(save_content)
+                image_converter = ImageConverter(
+                    save_content, output_format=output_format
+                )
                 try:
-                    # First resize the image
-                    save_content = image_converter.resize(self.convert_width)
-                    # Then compress the resized image if enabled
-                    if self.compress:
+                    # JPEGs are already compressed as they are encoded,
+                    # and kept as downloaded when not resized
+                    if self.compress and output_format == "png":
+                        # Resize, then compress the resized image as is,
+                        # without encoding and decoding it in between
                         save_content = image_converter.compress_image(
-                            Image.open(BytesIO(save_content)),
+                            image_converter.resize_image(self.convert_width),
                             image_full_path
                         )
                         # Output compressed image information
                         logging.info(
-                            "Compressed image size: %.2f MB" % (
-                                len(save_content) / (1024 * 1024)
-                            )
+                            "Compressed image size: %.2f MB",
+                            len(save_content) / (1024 * 1024)
+                        )
+                    else:
+                        save_content = image_converter.resize(
+                            self.convert_width
                         )
                 except Exception as e:
-                    logging.warn(f"Ignore to save image "
-                               f"{image_url} due to: {e}")
+                    logging.warn("Ignore to save image %s due to: %s",
+                                 image_url, e)
                     continue
+                finally:
+                    image_converter.close()
 
                 self.storage.write(
                     image_path, save_content, content_type="image")
@@ -421,7 +784,7 @@ class ImageDownloader:
 
     def upload_images(self, storage, image_paths):
         """Upload downloaded images to extra stroage"""
-        logging.info("Uploading images %s to storage..." % image_paths)
+        logging.info("Uploading images %s to storage...", image_paths)
         upload_images = []
         for image_path in image_paths:
             image_filename = os.path.basename(image_path)
@@ -429,107 +792,7 @@ class ImageDownloader:
                 self.path_prefix, image_filename)
             storage.cp_from_path(image_path, dest_image_path)
             upload_path = storage.full_path(dest_image_path)
-            logging.info("Success to upload image to %s" % upload_path)
+            logging.info("Success to upload image to %s", upload_path)
             upload_images.append(storage.full_path(dest_image_path))
 
         return upload_images
-
-    def serial_download_images(self):
-        """Download images one by one"""
-        # TODO(Ray): This method is not implemented enable_search_download
-        article_images = self.images
-        filter_images = []
-        filter_images_hashes = []
-        for idx, image_url in enumerate(article_images):
-            image_filename = "%s-%s.png" % (self.base_filename, idx)
-            image_path = os.path.join(self.path_prefix, image_filename)
-
-            logging.info("Filtering image from %s..." % image_url)
-            try:
-                save_content = None
-                if image_url.startswith('data:image/'):
-                    image_data = image_url.split(',')[-1]
-                    save_content = base64.b64decode(image_data)
-                else:
-                    response = requests.get(
-                        image_url, timeout=IMAGE_DOWNLOAD_TIMEOUT)
-                    save_content = response.content
-
-                if image_url.endswith('.svg'):
-                    save_content = cairosvg.svg2png(bytestring=save_content)
-
-                image_obj = Image.open(BytesIO(save_content))
-                width, height = image_obj.size
-
-                logging.debug("Image info: %s width = %s, height = %s" % (
-                    image_url, width, height))
-
-                # NOTE(Ray): Use image hash to remove duplicate images, dhash
-                # can remove duplicate images with different size and colors
-                image_hash = imagehash.dhash(image_obj)
-                if image_hash in filter_images_hashes:
-                    logging.warn("Duplicate image found, skip to "
-                                 "download image from %s" % image_url)
-                    continue
-                else:
-                    logging.debug("Add image hash %s" % image_hash)
-                    filter_images_hashes.append(image_hash)
-
-                # if image is top image, we still put it in filter images
-                # to ensure we can have a image
-                if image_url == self.top_image:
-                    logging.info("Filtered top image "
-                                 "by default %s" % image_url)
-                    filter_images.append(save_content)
-                    continue
-
-                if width >= self.filter_width and height >= self.filter_height:
-                    logging.info("Filtered image %s" % image_url)
-                    filter_images.append(save_content)
-                else:
-                    logging.warn("Ignore image %s due to "
-                                 "image is too small." % image_url)
-            except UnidentifiedImageError:
-                logging.warn("Failed to download image from %s to %s, "
-                             "due to download content is not valid "
-                             "image format" % (image_url, image_path))
-            except requests.exceptions.Timeout:
-                logging.warn("Skip to download image from %s to %s "
-                             "due to requests timeout" % (
-                                 image_url, image_path))
-            except Exception as e:
-                logging.warn("Failed to download image from %s to %s, "
-                             "due to: %s" % (image_url, image_path, e))
-                # logging.exception(e)
-
-        # logging.debug("Filtered images: %s" % filter_images)
-        # Get specific numbers of images
-        filtered_images = filter_images[0:self.max_download_num]
-
-        collect_images = []
-        save_index = 0
-        for idx, collect_image in enumerate(filtered_images):
-            image_filename = "%s-%s.png" % (
-                self.base_filename, save_index)
-            image_path = os.path.join(self.path_prefix, image_filename)
-
-            logging.info("Downloading image from %s to %s" % (
-                image_url, image_path))
-            save_content = collect_image
-
-            if self.storage.exists(image_path) and self.use_cache:
-                logging.info("Image already exists in %s" % image_path)
-            else:
-                logging.info("Writting image to path %s" % image_path)
-
-                image_converter = ImageConverter(save_content)
-                save_content = image_converter.resize(self.convert_width)
-
-                self.storage.write(
-                    image_path, save_content, content_type="image")
-
-            collect_images.append(self.storage.full_path(image_path))
-
-            save_index += 1
-
-        return collect_images
\ No newline at end of file
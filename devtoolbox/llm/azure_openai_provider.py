@@ -9,11 +9,12 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 import os
 
+import openai
 from langchain_openai import AzureChatOpenAI
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
     retry_if_exception_type,
     before_sleep_log
 )
@@ -21,8 +22,10 @@ from tenacity import (
 from devtoolbox.llm.openai_provider import (
     OpenAIProvider,
     OpenAIConfig,
+    OpenAIConnectionError,
     OpenAIError,
-    OpenAIRateLimitError
+    OpenAIRateLimitError,
+    get_http_client
 )
 from devtoolbox.llm.provider import register_provider, register_config
 
@@ -197,13 +200,18 @@ class AzureOpenAIProvider(OpenAIProvider):
             max_tokens=config.max_tokens,
             top_p=config.top_p,
             frequency_penalty=config.frequency_penalty,
-            presence_penalty=config.presence_penalty
+            presence_penalty=config.presence_penalty,
+            http_client=get_http_client()
         )
 
+    # Jittered backoff, so concurrent clients hitting the same rate
+    # limit do not all retry at the same instant
     @retry(
-        retry=retry_if_exception_type(OpenAIRateLimitError),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=30),
+        retry=retry_if_exception_type(
+            (OpenAIRateLimitError, OpenAIConnectionError)
+        ),
+        stop=stop_after_attempt(8),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     def chat(
@@ -228,6 +236,7 @@ class AzureOpenAIProvider(OpenAIProvider):
 
         Raises:
             OpenAIRateLimitError: If rate limit is exceeded
+            OpenAIConnectionError: If the API cannot be reached
             OpenAIError: If any other error occurs
         """
         try:
@@ -247,6 +256,11 @@ class AzureOpenAIProvider(OpenAIProvider):
         except Exception as e:
             if "rate_limit" in str(e).lower():
                 raise OpenAIRateLimitError("Rate limit exceeded")
+            # Covers timeouts as well
+            if isinstance(e, openai.APIConnectionError):
+                raise OpenAIConnectionError(
+                    f"Azure OpenAI API connection error: {e}"
+                )
             raise OpenAIError(f"Azure OpenAI API error: {e}")
 
     def complete(
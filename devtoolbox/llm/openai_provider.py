@@ -5,15 +5,18 @@ This module provides an implementation of the OpenAI provider using LangChain.
 
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 import os
 
+import httpx
+import openai
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from tenacity import (
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_exponential_jitter,
     retry_if_exception_type,
     before_sleep_log
 )
@@ -27,6 +30,35 @@ from devtoolbox.llm.provider import (
 
 logger = logging.getLogger(__name__)
 
+# Connections kept alive to the API by the shared HTTP client; override
+# with the OPENAI_HTTP_POOL_SIZE environment variable
+HTTP_POOL_SIZE = 32
+
+
+@lru_cache(maxsize=None)
+def get_http_client() -> httpx.Client:
+    """Get the HTTP client shared by all OpenAI providers in the process.
+
+    Each LangChain client otherwise opens its own connection pool, so
+    every new provider pays the TCP and TLS handshakes again. The client
+    is created on first use. Timeouts are left unset here, so the OpenAI
+    SDK keeps applying its own per request.
+
+    Returns:
+        httpx.Client: Client with keep-alive connection pooling
+    """
+    pool_size = int(
+        os.environ.get('OPENAI_HTTP_POOL_SIZE', HTTP_POOL_SIZE)
+    )
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=pool_size * 2,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=60.0
+        ),
+        follow_redirects=True
+    )
+
 
 @register_config('openai')
 @dataclass
@@ -134,6 +166,11 @@ class OpenAIRateLimitError(OpenAIError):
     pass
 
 
+class OpenAIConnectionError(OpenAIError):
+    """Raised when the OpenAI API cannot be reached or times out."""
+    pass
+
+
 @register_provider('OpenAIProvider')
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI provider implementation using LangChain.
@@ -164,7 +201,8 @@ class OpenAIProvider(BaseLLMProvider):
             openai_api_base=config.api_base,
             top_p=config.top_p,
             frequency_penalty=config.frequency_penalty,
-            presence_penalty=config.presence_penalty
+            presence_penalty=config.presence_penalty,
+            http_client=get_http_client()
         )
 
     def _convert_messages(self, messages: List[Dict[str, str]]) -> List[Any]:
@@ -191,10 +229,14 @@ class OpenAIProvider(BaseLLMProvider):
                 converted_messages.append(HumanMessage(content=content))
         return converted_messages
 
+    # Jittered backoff, so concurrent clients hitting the same rate
+    # limit do not all retry at the same instant
     @retry(
-        retry=retry_if_exception_type(OpenAIRateLimitError),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=4, max=30),
+        retry=retry_if_exception_type(
+            (OpenAIRateLimitError, OpenAIConnectionError)
+        ),
+        stop=stop_after_attempt(8),
+        wait=wait_exponential_jitter(initial=1, max=30, jitter=2),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     def chat(
@@ -219,6 +261,7 @@ class OpenAIProvider(BaseLLMProvider):
 
         Raises:
             OpenAIRateLimitError: If rate limit is exceeded
+            OpenAIConnectionError: If the API cannot be reached
             OpenAIError: If any other error occurs
         """
         try:
@@ -238,6 +281,11 @@ class OpenAIProvider(BaseLLMProvider):
         except Exception as e:
             if "rate_limit" in str(e).lower():
                 raise OpenAIRateLimitError("Rate limit exceeded")
+            # Covers timeouts as well
+            if isinstance(e, openai.APIConnectionError):
+                raise OpenAIConnectionError(
+                    f"OpenAI API connection error: {str(e)}"
+                )
             raise OpenAIError(f"OpenAI API error: {str(e)}")
 
     def complete(
@@ -68,8 +68,8 @@ class MarkdownImageDownloader(MarkdownBase):
             str: Path to the converted image or original if conversion failed.
         """
         try:
-            converter = ImageConverter(save_path)
-            converted_path = converter.convert_to_png()
+            with ImageConverter(save_path) as converter:
+                converted_path = converter.convert_to_png()
             if converted_path != save_path:
                 logging.info(f"Converted image to PNG: {converted_path}")
                 return converted_path
@@ -86,6 +86,7 @@ class OCRService:
         file_path: Union[str, Path],
         skip_invalid: bool = False,
         raw_response: bool = False,
+        validate: bool = True,
         **kwargs
     ) -> Union[List[str], Any]:
         """
@@ -99,6 +100,9 @@ class OCRService:
             skip_invalid: Whether to skip invalid files instead of raising errors
             raw_response: If True, returns raw provider response.
                          If False (default), returns list of strings only.
+            validate: Whether to check the file against the provider
+                     requirements first. Pass False for files that were
+                     already validated.
             **kwargs: Additional provider-specific parameters
 
         Returns:
@@ -125,7 +129,7 @@ class OCRService:
         file_path = Path(file_path)
 
         if self._is_image_file(file_path):
-            if not raw_response:
+            if validate and not raw_response:
                 is_compliant, reason = (
                     self.provider.validate_image_compliance(
                         file_path
@@ -148,7 +152,7 @@ class OCRService:
             )
 
         elif self._is_document_file(file_path):
-            if not raw_response:
+            if validate and not raw_response:
                 is_compliant, reason = (
                     self.provider.validate_document_compliance(
                         file_path
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 import json
 from typing import Optional, List
 import os
+import threading
 import time
 import uuid
 
@@ -266,6 +267,9 @@ class AzureProvider(BaseSpeechProvider):
         self._speech_config = None
         self._speech_recognizer = None
         self._azure_client = None  # Lazy initialization
+        # Guards the lazy initializations, as chunks may be transcribed
+        # from several threads at once
+        self._init_lock = threading.Lock()
 
         logger.info(
             "Initializing Azure provider "
@@ -285,14 +289,20 @@ class AzureProvider(BaseSpeechProvider):
             AzureConfigError: If speech config creation fails
         """
         if self._speech_config is None:
-            try:
-                self._speech_config = speechsdk.SpeechConfig(
-                    subscription=self.config.subscription_key,
-                    region=self.config.service_region
-                )
-                logger.debug("Azure speech config created successfully")
-            except Exception as e:
-                raise AzureConfigError(f"Failed to create speech config: {str(e)}")
+            with self._init_lock:
+                if self._speech_config is None:
+                    try:
+                        self._speech_config = speechsdk.SpeechConfig(
+                            subscription=self.config.subscription_key,
+                            region=self.config.service_region
+                        )
+                        logger.debug(
+                            "Azure speech config created successfully"
+                        )
+                    except Exception as e:
+                        raise AzureConfigError(
+                            f"Failed to create speech config: {str(e)}"
+                        )
         return self._speech_config
 
     @property
@@ -302,7 +312,9 @@ class AzureProvider(BaseSpeechProvider):
         Only create when needed (e.g., batch transcription).
         """
         if self._azure_client is None:
-            self._azure_client = AzureClient(self.config)
+            with self._init_lock:
+                if self._azure_client is None:
+                    self._azure_client = AzureClient(self.config)
         return self._azure_client
 
     def _handle_synthesis_result(
@@ -84,6 +84,9 @@ class BaseSpeechProvider(ABC):
     operations.
     """
 
+    # Whether transcribe() may be called from several threads at once
+    supports_concurrent_transcription = True
+
     def __init__(self, config: BaseSpeechConfig):
         """Initialize the provider.
 
@@ -11,7 +11,11 @@ import hashlib
 import logging
 import shutil
 import json
-from typing import List, Optional, Tuple, Dict, Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    List, Optional, Tuple, Dict, Any, Iterable, Iterator
+)
 from dataclasses import asdict
 
 from pydub import AudioSegment
@@ -57,6 +61,8 @@ class SpeechService:
     DEFAULT_SILENCE_LEN = 1000  # ms
     DEFAULT_SILENCE_THRESH = -40  # dB
     DEFAULT_KEEP_SILENCE = 500  # ms
+    DEFAULT_SENTENCE_PAUSE = 200  # ms
+    STREAM_BLOCK_SIZE = 64 * 1024  # characters of text split at once
     DEFAULT_OUTPUT_FORMAT = "txt"
 
     # Supported output formats
@@ -216,7 +222,10 @@ class SpeechService:
         use_cache: bool = True,
         speaker: Optional[str] = None,
         rate: int = 0,
-        cleanup_cache: bool = False
+        cleanup_cache: bool = False,
+        cache_dir: Optional[str] = None,
+        sentence_level: bool = False,
+        jobs: int = 1
     ) -> str:
         """Convert text to speech with caching.
 
@@ -227,6 +236,12 @@ class SpeechService:
             speaker: Voice to use for synthesis
             rate: Speech rate adjustment
             cleanup_cache: Whether to clean up cache after processing
+            cache_dir: Directory for cached segments. Defaults to the
+                per-output <output_filename>.chunk/ directory; pass a
+                shared directory to reuse segments across outputs.
+            sentence_level: Synthesize and cache each sentence on its own
+                so that editing one sentence only re-synthesizes it
+            jobs: Number of segments synthesized in parallel
 
         Returns:
             str: Path to the generated audio file
@@ -236,96 +251,243 @@ class SpeechService:
         """
         logger.info("Starting text-to-speech conversion")
         logger.debug("Input text length: %d characters", len(text))
-        logger.debug("Output path: %s", output_path)
-        logger.debug("Use cache: %s, Speaker: %s, Rate: %d",
-                    use_cache, speaker, rate)
 
         # Text splitting strategy:
         # - Split long text into manageable segments to avoid memory issues
         # - Each segment is processed independently and can be cached
         # - Segments are recombined into final audio file
-        segments = self._split_text(text)
+        segments = self._split_text(text, sentence_level=sentence_level)
         logger.info("Text split into %d segments", len(segments))
 
+        return self._synthesize_segments(
+            segments,
+            output_path,
+            use_cache=use_cache,
+            speaker=speaker,
+            rate=rate,
+            cleanup_cache=cleanup_cache,
+            cache_dir=cache_dir,
+            sentence_level=sentence_level,
+            jobs=jobs
+        )
+
+    def text_file_to_speech(
+        self,
+        text_path: str,
+        output_path: str,
+        use_cache: bool = True,
+        speaker: Optional[str] = None,
+        rate: int = 0,
+        cleanup_cache: bool = False,
+        cache_dir: Optional[str] = None,
+        sentence_level: bool = False,
+        jobs: int = 1
+    ) -> str:
+        """Convert a text file to speech without loading it at once.
+
+        The file is read and split block by block, so memory used for
+        the text does not grow with the size of the input.
+
+        Args:
+            text_path: Path to the UTF-8 text file to convert
+            output_path: Path to save the audio file
+            use_cache: Whether to use cache
+            speaker: Voice to use for synthesis
+            rate: Speech rate adjustment
+            cleanup_cache: Whether to clean up cache after processing
+            cache_dir: Directory for cached segments, see text_to_speech
+            sentence_level: Synthesize and cache each sentence on its own
+            jobs: Number of segments synthesized in parallel
+
+        Returns:
+            str: Path to the generated audio file
+
+        Raises:
+            Exception: If text-to-speech fails
+        """
+        logger.info("Starting text-to-speech conversion of %s", text_path)
+        return self._synthesize_segments(
+            self._iter_file_segments(text_path, sentence_level),
+            output_path,
+            use_cache=use_cache,
+            speaker=speaker,
+            rate=rate,
+            cleanup_cache=cleanup_cache,
+            cache_dir=cache_dir,
+            sentence_level=sentence_level,
+            jobs=jobs
+        )
+
+    def _iter_file_segments(
+        self,
+        text_path: str,
+        sentence_level: bool = False
+    ) -> Iterator[str]:
+        """Yield the text segments of a file block by block.
+
+        Lines are collected until a block of at least STREAM_BLOCK_SIZE
+        characters ends on a paragraph break, so paragraphs are never
+        cut in the middle.
+
+        Args:
+            text_path: Path to the UTF-8 text file
+            sentence_level: Yield sentences instead of paragraphs
+
+        Yields:
+            str: Text segments in file order
+        """
+        block = []
+        block_size = 0
+        with open(text_path, "r", encoding="utf-8") as f:
+            for line in f:
+                block.append(line)
+                block_size += len(line)
+                if block_size >= self.STREAM_BLOCK_SIZE and not line.strip():
+                    yield from self._split_text(
+                        "".join(block), sentence_level=sentence_level)
+                    block = []
+                    block_size = 0
+        if "".join(block).strip():
+            yield from self._split_text(
+                "".join(block), sentence_level=sentence_level)
+
+    def _synthesize_segments(
+        self,
+        segments: Iterable[str],
+        output_path: str,
+        use_cache: bool = True,
+        speaker: Optional[str] = None,
+        rate: int = 0,
+        cleanup_cache: bool = False,
+        cache_dir: Optional[str] = None,
+        sentence_level: bool = False,
+        jobs: int = 1
+    ) -> str:
+        """Synthesize text segments and combine them into one file.
+
+        Segments are consumed lazily and at most twice the number of
+        jobs are in flight at once, so a long input never has all of
+        its text or pending audio in memory.
+
+        Args:
+            segments: Text segments in playback order
+            output_path: Path to save the audio file
+            use_cache: Whether to use cache
+            speaker: Voice to use for synthesis
+            rate: Speech rate adjustment
+            cleanup_cache: Whether to clean up cache after processing
+            cache_dir: Directory for cached segments
+            sentence_level: Separate segments with a short pause
+            jobs: Number of segments synthesized in parallel
+
+        Returns:
+            str: Path to the generated audio file
+
+        Raises:
+            Exception: If text-to-speech fails
+        """
+        logger.debug("Output path: %s", output_path)
+        logger.debug("Use cache: %s, Speaker: %s, Rate: %d, Jobs: %d",
+                    use_cache, speaker, rate, jobs)
+
         # Cache and temporary directory setup:
-        # - Create cache directory based on output filename
-        # - Use same directory for temporary files during processing
-        # - Cache directory structure: <output_filename>.chunk/
-        cache_dir = self._setup_cache_dir(output_path)
+        # - Create temporary directory based on output filename
+        # - Cache in the same directory unless a shared one is given
+        # - Temporary directory structure: <output_filename>.chunk/
         temp_dir = self._setup_temp_dir(output_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        else:
+            cache_dir = temp_dir
+
+        def synthesize(i: int, segment: str) -> AudioSegment:
+            # Cache key generation:
+            # - Hash segment text together with provider and voice
+            # - Ensures identical requests use same cache
+            # - Cache file extension matches audio format
+            segment_hash = self._segment_cache_key(segment, speaker, rate)
+            cache_path = self._get_cache_path(
+                cache_dir, segment_hash, self.AUDIO_FORMAT)
+            temp_path = os.path.join(
+                temp_dir, f"segment_{i}.{self.AUDIO_FORMAT}")
+
+            # Cache lookup and audio generation:
+            # - Check if cached audio exists and cache is enabled
+            # - Load cached audio if available
+            # - Otherwise, generate new audio using TTS provider
+            # - Save to cache for future use if caching enabled
+            if use_cache and os.path.exists(cache_path):
+                logger.debug("Using cached segment %d", i)
+                return AudioSegment.from_file(cache_path)
+
+            logger.info("Generating new audio for segment %d", i)
+            segment_preview = (segment[:100] + "..."
+                             if len(segment) > 100 else segment)
+            logger.debug("Segment content: %s", segment_preview)
+
+            # TTS provider call:
+            # - Convert text segment to speech
+            # - Apply speaker voice and rate settings
+            # - Save temporary audio file
+            self.provider.speak(
+                segment,
+                temp_path,
+                speaker=speaker,
+                rate=rate
+            )
+            audio = AudioSegment.from_file(temp_path)
 
-        try:
-            # Segment processing loop:
-            # - Process each text segment individually
-            # - Generate hash for caching based on segment content
-            # - Check cache first, then generate new audio if needed
-            # - Cache generated audio for future reuse
-            audio_segments = []
-            for i, segment in enumerate(segments):
-                logger.debug("Processing segment %d/%d", i + 1, len(segments))
-
-                # Cache key generation:
-                # - Use MD5 hash of segment text as cache key
-                # - Ensures identical text segments use same cache
-                # - Cache file extension matches audio format
-                segment_hash = hashlib.md5(segment.encode()).hexdigest()
-                cache_path = self._get_cache_path(
-                    cache_dir, segment_hash, self.AUDIO_FORMAT)
-                temp_path = os.path.join(
-                    temp_dir, f"segment_{i}.{self.AUDIO_FORMAT}")
-
-                # Cache lookup and audio generation:
-                # - Check if cached audio exists and cache is enabled
-                # - Load cached audio if available
-                # - Otherwise, generate new audio using TTS provider
-                # - Save to cache for future use if caching enabled
-                if use_cache and os.path.exists(cache_path):
-                    logger.debug("Using cached segment %d", i)
-                    audio = AudioSegment.from_file(cache_path)
-                else:
-                    logger.info("Generating new audio for segment %d", i)
-                    segment_preview = (segment[:100] + "..."
-                                     if len(segment) > 100 else segment)
-                    logger.debug("Segment content: %s", segment_preview)
-
-                    # TTS provider call:
-                    # - Convert text segment to speech
-                    # - Apply speaker voice and rate settings
-                    # - Save temporary audio file
-                    self.provider.speak(
-                        segment,
-                        temp_path,
-                        speaker=speaker,
-                        rate=rate
-                    )
-                    audio = AudioSegment.from_file(temp_path)
-
-                    # Cache management:
-                    # - Export audio with consistent format and bitrate
-                    # - Save to cache directory for future reuse
-                    # - Cache key ensures identical segments use same cache
-                    if use_cache:
-                        audio.export(
-                            cache_path,
-                            format=self.AUDIO_FORMAT,
-                            bitrate=self.AUDIO_BITRATE
-                        )
-                        logger.debug("Cached segment %d at: %s", i, cache_path)
-
-                audio_segments.append(audio)
+            # Cache management:
+            # - Export audio with consistent format and bitrate
+            # - Save to cache directory for future reuse
+            # - Cache key ensures identical segments use same cache
+            if use_cache:
+                audio.export(
+                    cache_path,
+                    format=self.AUDIO_FORMAT,
+                    bitrate=self.AUDIO_BITRATE
+                )
+                logger.debug("Cached segment %d at: %s", i, cache_path)
+            return audio
 
+        try:
             # Audio combination strategy:
-            # - Combine all audio segments into single file
-            # - Handle single segment case separately
-            # - Concatenate segments in order for multi-segment case
+            # - Submit segments while keeping a bounded window in flight
+            # - Append finished segments strictly in submission order
+            # - Separate sentences with a short pause in sentence mode
             # - Export final combined audio with consistent settings
-            logger.info("Combining %d audio segments", len(audio_segments))
-            if len(audio_segments) == 1:
-                combined = audio_segments[0]
-            else:
-                combined = audio_segments[0]
-                for segment in audio_segments[1:]:
-                    combined += segment
+            pause = None
+            if sentence_level:
+                pause = AudioSegment.silent(
+                    duration=self.DEFAULT_SENTENCE_PAUSE)
+            combined = None
+            count = 0
+            pending = deque()
+
+            def append_next():
+                nonlocal combined
+                audio = pending.popleft().result()
+                if combined is None:
+                    combined = audio
+                    return
+                if pause is not None:
+                    combined += pause
+                combined += audio
+
+            with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+                for i, segment in enumerate(segments):
+                    logger.debug("Processing segment %d", i + 1)
+                    pending.append(executor.submit(synthesize, i, segment))
+                    count += 1
+                    if len(pending) >= 2 * max(1, jobs):
+                        append_next()
+                while pending:
+                    append_next()
+
+            if combined is None:
+                raise ValueError("No text to convert to speech")
+
+            logger.info("Combined %d audio segments", count)
             combined.export(
                 output_path,
                 format=self.AUDIO_FORMAT,
@@ -339,18 +501,47 @@ class SpeechService:
             raise
         finally:
             # Cleanup phase:
-            # - Optionally clean up cache directory after processing
-            # - Ensures temporary files are removed if requested
+            # - Optionally clean up the per-output directory
+            # - A shared cache directory is never removed here
             # - Always executed regardless of success or failure
             if cleanup_cache:
                 logger.info("Cleaning up cache directory")
-                self._cleanup_cache_dir(cache_dir)
+                self._cleanup_cache_dir(temp_dir)
+
+    def _segment_cache_key(
+        self,
+        segment: str,
+        speaker: Optional[str],
+        rate: int
+    ) -> str:
+        """Build the cache key of a synthesized text segment.
+
+        Args:
+            segment: Text of the segment
+            speaker: Voice used for synthesis
+            rate: Speech rate adjustment
 
-    def _split_text(self, text: str) -> List[str]:
+        Returns:
+            str: Hex digest identifying the segment audio
+        """
+        key = "|".join([
+            segment,
+            self.config.__class__.__name__,
+            speaker or "",
+            str(rate)
+        ])
+        return hashlib.md5(key.encode()).hexdigest()
+
+    def _split_text(
+        self,
+        text: str,
+        sentence_level: bool = False
+    ) -> List[str]:
         """Split text into segments.
 
         Args:
             text: Text to split
+            sentence_level: Return sentences instead of paragraphs
 
         Returns:
             List[str]: List of text segments
@@ -359,6 +550,12 @@ class SpeechService:
         splitter = TokenSplitter(text)
         paragraphs = splitter.split()
         logger.debug("Text split into %d paragraphs", len(paragraphs))
+        if sentence_level:
+            return [
+                sentence
+                for p in paragraphs
+                for sentence in (p.sentences or [p.text])
+            ]
         return [p.text for p in paragraphs]
 
     def _format_as_text(
@@ -452,7 +649,8 @@ class SpeechService:
         min_chunk_duration: int = DEFAULT_MIN_CHUNK_DURATION,
         max_chunk_duration: int = DEFAULT_MAX_CHUNK_DURATION,
         vad_aggressiveness: int = DEFAULT_VAD_AGGRESSIVENESS,
-        max_wait_for_silence: int = DEFAULT_MAX_WAIT_FOR_SILENCE
+        max_wait_for_silence: int = DEFAULT_MAX_WAIT_FOR_SILENCE,
+        jobs: int = 1
     ) -> list:
         # Use split_speech_chunks to get List[ChunkMeta]
         from devtoolbox.speech.utils import ChunkMeta
@@ -464,8 +662,18 @@ class SpeechService:
             vad_aggressiveness,
             max_wait_for_silence
         )
-        logger.info(f"Audio split into {len(chunk_metas)} chunks")
-        for chunk in chunk_metas:
+        logger.info("Audio split into %d chunks", len(chunk_metas))
+
+        # Chunks are prepared (transcoded, hashed and looked up in the
+        # cache) in order on one thread while chunks that are already
+        # prepared are transcribed on a second pool, so transcoding
+        # chunk j+1 overlaps with transcribing chunk j
+        if not self.provider.supports_concurrent_transcription:
+            jobs = 1
+        jobs = max(1, jobs)
+        logger.info("Transcribing chunks with %d worker(s)", jobs)
+
+        def prepare_chunk(chunk):
             # Transcode wav to mp3
             mp3_path = os.path.splitext(chunk.wav_path)[0] + '.mp3'
             convert_audio_ffmpeg(
@@ -488,9 +696,12 @@ class SpeechService:
                 with open(cache_path, "r") as f:
                     chunk.transcript = f.read().strip()
                 chunk.cached = True
-                continue
+                return None
+            return cache_path
 
-            temp_output = os.path.join(temp_dir, f"chunk_{chunk.index}.txt")
+        def transcribe_chunk(chunk, cache_path):
+            temp_output = os.path.join(
+                temp_dir, f"chunk_{chunk.index}.txt")
             self.provider.transcribe(chunk.wav_path, temp_output)
             with open(temp_output, "r") as f:
                 chunk.transcript = f.read().strip()
@@ -498,6 +709,26 @@ class SpeechService:
             if use_cache:
                 with open(cache_path, "w") as f:
                     f.write(chunk.transcript)
+
+        with ThreadPoolExecutor(max_workers=1) as prepare_pool, \
+                ThreadPoolExecutor(max_workers=jobs) as transcribe_pool:
+            prepared = [
+                prepare_pool.submit(prepare_chunk, chunk)
+                for chunk in chunk_metas
+            ]
+            transcribing = []
+            for chunk, future in zip(chunk_metas, prepared):
+                cache_path = future.result()
+                if cache_path is not None:
+                    transcribing.append(transcribe_pool.submit(
+                        transcribe_chunk, chunk, cache_path))
+            # Wait for every transcription so worker errors are raised
+            for future in transcribing:
+                future.result()
+        logger.info(
+            "Transcribed %d chunks, %d served from cache",
+            len(transcribing), len(chunk_metas) - len(transcribing)
+        )
         return chunk_metas
 
     def _generate_metadata(
@@ -565,23 +796,24 @@ class SpeechService:
         min_chunk_duration: int = DEFAULT_MIN_CHUNK_DURATION,
         max_chunk_duration: int = DEFAULT_MAX_CHUNK_DURATION,
         vad_aggressiveness: int = DEFAULT_VAD_AGGRESSIVENESS,
-        max_wait_for_silence: int = DEFAULT_MAX_WAIT_FOR_SILENCE
+        max_wait_for_silence: int = DEFAULT_MAX_WAIT_FOR_SILENCE,
+        jobs: int = 1
     ) -> dict:
         logger.info(
-            f"Starting speech-to-text conversion: input={speech_path}, "
-            f"output={output_path}, format={output_format}, "
-            f"use_cache={use_cache}, cleanup_cache={cleanup_cache}, "
-            f"min_chunk_duration={min_chunk_duration}, "
-            f"max_chunk_duration={max_chunk_duration}, "
-            f"vad_aggressiveness={vad_aggressiveness}, "
-            f"max_wait_for_silence={max_wait_for_silence}"
+            "Starting speech-to-text conversion: input=%s, output=%s, "
+            "format=%s, use_cache=%s, cleanup_cache=%s, "
+            "min_chunk_duration=%s, max_chunk_duration=%s, "
+            "vad_aggressiveness=%s, max_wait_for_silence=%s",
+            speech_path, output_path, output_format, use_cache,
+            cleanup_cache, min_chunk_duration, max_chunk_duration,
+            vad_aggressiveness, max_wait_for_silence
         )
-        logger.debug(f"Input audio file: {speech_path}")
+        logger.debug("Input audio file: %s", speech_path)
         logger.debug(
-            f"Output file: {output_path}, Format: {output_format}"
+            "Output file: %s, Format: %s", output_path, output_format
         )
         logger.debug(
-            f"Use cache: {use_cache}, Cleanup cache: {cleanup_cache}"
+            "Use cache: %s, Cleanup cache: %s", use_cache, cleanup_cache
         )
         cache_dir = self._setup_cache_dir(speech_path)
         temp_dir = self._setup_temp_dir(speech_path)
@@ -595,23 +827,26 @@ class SpeechService:
                 min_chunk_duration,
                 max_chunk_duration,
                 vad_aggressiveness,
-                max_wait_for_silence
+                max_wait_for_silence,
+                jobs
             )
             logger.info(
-                f"Generating final content: output={output_path}, "
-                f"format={output_format}, total_chunks={len(chunk_metas)}"
+                "Generating final content: output=%s, format=%s, "
+                "total_chunks=%d",
+                output_path, output_format, len(chunk_metas)
             )
             # Compose final text from all transcripts
             final_text = "\n".join(chunk.transcript or "" for chunk in chunk_metas)
             logger.debug(
-                f"Final content length: {len(final_text)} characters, "
-                f"output file: {output_path}"
+                "Final content length: %d characters, output file: %s",
+                len(final_text), output_path
             )
             with open(output_path, "w", encoding="utf-8") as f:
                 f.write(final_text)
             logger.info(
-                f"Transcription successfully saved: {output_path} "
-                f"(length: {len(final_text)} characters)"
+                "Transcription successfully saved: %s "
+                "(length: %d characters)",
+                output_path, len(final_text)
             )
             metadata = self._generate_metadata(
                 chunk_metas, None, output_path
@@ -619,8 +854,8 @@ class SpeechService:
             with open(metadata_path, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2, ensure_ascii=False)
             logger.info(
-                f"Metadata successfully saved: {metadata_path} "
-                f"(size: {os.path.getsize(metadata_path)} bytes)"
+                "Metadata successfully saved: %s (size: %d bytes)",
+                metadata_path, os.path.getsize(metadata_path)
             )
             return {
                 "output_path": output_path,
@@ -629,15 +864,14 @@ class SpeechService:
             }
         except Exception as e:
             logger.error(
-                f"Error in speech-to-text processing: input={speech_path}, "
-                f"output={output_path}, format={output_format}, error={str(e)}"
+                "Error in speech-to-text processing: input=%s, output=%s, "
+                "format=%s, error=%s",
+                speech_path, output_path, output_format, str(e)
             )
             raise
         finally:
             if cleanup_cache:
-                logger.info(
-                    f"Cleaning up cache directory: {cache_dir}"
-                )
+                logger.info("Cleaning up cache directory: %s", cache_dir)
                 self._cleanup_cache_dir(cache_dir)
 
     def list_speakers(self) -> List[str]:
@@ -192,6 +192,10 @@ class WhisperTranscriptionError(WhisperError):
 class WhisperProvider(BaseSpeechProvider):
     """Whisper speech provider implementation."""
 
+    # The model is shared and runs locally, so chunks are transcribed one
+    # at a time
+    supports_concurrent_transcription = False
+
     def __init__(self, config: WhisperConfig):
         """Initialize Whisper provider.
 
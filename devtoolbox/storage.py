@@ -1,13 +1,16 @@
 import glob
 import logging
+from contextlib import contextmanager
 from io import BytesIO
 import os
+import re
 from pathlib import Path
 import shutil
 import fnmatch
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
-from minio import Minio, error
 
 # Content type constants
 TEXT_CONTENT_TYPE = "text"
@@ -23,6 +26,47 @@ OSS_CONTENT_TYPES = {
 logger = logging.getLogger(__name__)
 
 
+# Connections kept per host by the object storage HTTP pool. It must
+# cover the parallel transfers, or sockets beyond it are discarded and
+# reopened for every request.
+MAX_POOL_CONNECTIONS = 32
+
+
+def _http_client():
+    """Create the pooled HTTP client used by MinIO clients.
+
+    Same settings as the MinIO default, with a larger pool.
+    """
+    # Lazy import to speed up CLI startup
+    import certifi
+    import urllib3
+
+    timeout = timedelta(minutes=5).seconds
+    return urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=MAX_POOL_CONNECTIONS,
+        cert_reqs="CERT_REQUIRED",
+        ca_certs=os.environ.get("SSL_CERT_FILE") or certifi.where(),
+        retries=urllib3.Retry(
+            total=5,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504]
+        )
+    )
+
+
+def _minio_client(*args, **kwargs):
+    """Create a MinIO client, importing the SDK only when first needed.
+
+    Importing minio dominates the import time of this module, and file
+    storage never needs it.
+    """
+    # Lazy import to speed up CLI startup
+    from minio import Minio as MinioClient
+    kwargs.setdefault("http_client", _http_client())
+    return MinioClient(*args, **kwargs)
+
+
 class BaseStorage:
     """Base storage class that defines the interface for all storage
     implementations.
@@ -58,11 +102,21 @@ class BaseStorage:
         """Read content from the specified path."""
         raise NotImplementedError("read() method needs to be implemented")
 
+    def open(self, path):
+        """Open the specified path as a binary stream for reading."""
+        raise NotImplementedError("open() method needs to be implemented")
+
     def write(self, path, content,
               content_type=TEXT_CONTENT_TYPE, *args, **kwargs):
         """Write content to the specified path."""
         raise NotImplementedError("write() method needs to be implemented")
 
+    def write_stream(self, path, stream, content_type=TEXT_CONTENT_TYPE):
+        """Write everything read from a binary stream to the path."""
+        raise NotImplementedError(
+            "write_stream() method needs to be implemented"
+        )
+
     def exists(self, path, *args, **kwargs):
         """Check if the specified path exists."""
         raise NotImplementedError("exists() method needs to be implemented")
@@ -78,10 +132,18 @@ class BaseStorage:
             "cp_from_path() method needs to be implemented"
         )
 
+    def copy(self, src_path, dest_path):
+        """Copy a file already in storage to another path."""
+        raise NotImplementedError("copy() method needs to be implemented")
+
     def ls(self, path=None, pattern="*"):
         """List all files and return their full paths."""
         raise NotImplementedError("ls() method needs to be implemented")
 
+    def iter_ls(self, path=None, pattern="*"):
+        """Yield the files ls() would return as they are found."""
+        yield from self.ls(path, pattern)
+
     def rm(self, path, recursive=False):
         """Remove a file or directory.
 
@@ -96,6 +158,21 @@ class BaseStorage:
         """
         raise NotImplementedError("rm() method needs to be implemented")
 
+    def rm_many(self, paths):
+        """Remove many files, one at a time.
+
+        Args:
+            paths (Iterable[str]): The paths to remove.
+
+        Returns:
+            int: Number of files removed.
+        """
+        removed = 0
+        for path in paths:
+            self.rm(path)
+            removed += 1
+        return removed
+
 
 class ObjectStorage(BaseStorage):
     """Storage implementation for object storage services like S3, MinIO,
@@ -115,6 +192,15 @@ class ObjectStorage(BaseStorage):
     other object storage services that implement the S3 protocol.
     """
 
+    # Keys per DeleteObjects request (the S3 maximum) and number of such
+    # requests in flight during recursive removal
+    DELETE_BATCH_SIZE = 1000
+    DELETE_CONCURRENCY = 8
+
+    # Part size for streams of unknown length, which are always sent as
+    # a multipart upload
+    STREAM_PART_SIZE = 16 * 1024 * 1024
+
     def __init__(self, base_path, *args, **kwargs):
         """Initialize object storage.
 
@@ -168,7 +254,7 @@ class ObjectStorage(BaseStorage):
 
         # Initialize Minio client
         try:
-            self.client = Minio(
+            self.client = _minio_client(
                 self.endpoint,
                 access_key=access_key,
                 secret_key=secret_key,
@@ -238,6 +324,30 @@ class ObjectStorage(BaseStorage):
                 response.close()
                 response.release_conn()
 
+    @contextmanager
+    def open(self, path):
+        """Open an object as a binary stream for reading.
+
+        Unlike read(), the body is not loaded into memory; it is read
+        from the connection as the caller consumes it.
+
+        Args:
+            path (str): The path to the object in storage.
+
+        Yields:
+            urllib3.response.HTTPResponse: File-like object body.
+        """
+        logger.info(
+            "Opening from object storage: bucket=%s, path=%s",
+            self.bucket, path
+        )
+        response = self.client.get_object(self.bucket, path)
+        try:
+            yield response
+        finally:
+            response.close()
+            response.release_conn()
+
     def _get_content_type_from_path(self, path):
         """Determine content type from file extension.
 
@@ -329,21 +439,67 @@ class ObjectStorage(BaseStorage):
             logger.exception(e)
             raise
 
+    def write_stream(self, path, stream, content_type=TEXT_CONTENT_TYPE):
+        """Write a binary stream to object storage.
+
+        The stream is uploaded in parts of STREAM_PART_SIZE bytes as it
+        is read, so its length does not need to be known up front and
+        it is never held in memory as a whole.
+
+        Args:
+            path (str): The path to the object in storage.
+            stream: Binary file-like object to read from.
+            content_type (str, optional): The content type of the file.
+
+        Returns:
+            ObjectWriteResult: The result of the upload.
+        """
+        write_content_type = OSS_CONTENT_TYPES.get(content_type,
+                                                   OSS_TEXT_CONTENT_TYPE)
+        logger.info(
+            "Streaming to object storage: bucket=%s, path=%s, "
+            "content_type=%s", self.bucket, path, write_content_type
+        )
+        try:
+            return self.client.put_object(
+                self.bucket, path, stream, -1,
+                content_type=write_content_type,
+                part_size=self.STREAM_PART_SIZE
+            )
+        except Exception as e:
+            logger.error("Error streaming to object storage: %s", str(e))
+            raise
+
+    def stat(self, path):
+        """Get object metadata with a single HEAD request.
+
+        Args:
+            path (str): The object path in the bucket.
+
+        Returns:
+            The object stat, or None if the object does not exist.
+        """
+        from minio.error import S3Error
+
+        try:
+            return self.client.stat_object(self.bucket, path)
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            logger.error(f"Error getting object stat: {str(e)}")
+            raise e
+
     def exists(self, path, *args, **kwargs):
-        """Check if object exists in storage."""
+        """Check if object exists in storage.
+
+        This is a single HEAD request, independent of how many objects
+        share the prefix.
+        """
         logger.info(f"Checking if object exists: bucket={self.bucket}, "
                     f"path={path}")
-        try:
-            self.client.stat_object(self.bucket, path)
-            logger.debug(f"Object exists: {path}")
-            return True
-        except error.S3Error as e:
-            if e.code == "NoSuchKey":
-                logger.debug(f"Object does not exist: {path}")
-                return False
-            else:
-                logger.error(f"Error checking if object exists: {str(e)}")
-                raise e
+        exists = self.stat(path) is not None
+        logger.debug(f"Object {path} exists: {exists}")
+        return exists
 
     def full_path(self, path, *args, **kwargs):
         """Generate a link for the object."""
@@ -365,40 +521,101 @@ class ObjectStorage(BaseStorage):
 
     def cp_from_path(self, src_full_path, dest_path,
                      content_type=TEXT_CONTENT_TYPE, *args, **kwargs):
-        """Copy file from local path to object storage."""
+        """Copy file from local path to object storage.
+
+        The file is streamed from disk; large files are sent as a
+        multipart upload so memory use is bounded by the part size.
+
+        Args:
+            src_full_path (str): The local file to upload.
+            dest_path (str): The object path in the bucket.
+            content_type (str, optional): The content type of the file.
+            **kwargs: Additional keyword arguments.
+                part_size (int): Multipart part size in bytes (minimum
+                    5MB). Chosen by the client when not provided.
+                num_parallel_uploads (int): Number of parts uploaded
+                    concurrently. Defaults to 3.
+                progress: Object with set_meta(object_name,
+                    total_length) and update(length) methods, called
+                    as the upload proceeds.
+        """
         logger.info(f"Copying {src_full_path} to {dest_path}...")
         write_content_type = OSS_CONTENT_TYPES.get(
             content_type, OSS_TEXT_CONTENT_TYPE)
         logger.debug(f"Using content type: {write_content_type}")
 
+        upload_options = {
+            key: kwargs[key]
+            for key in ("part_size", "num_parallel_uploads", "progress")
+            if kwargs.get(key) is not None
+        }
+
         try:
             result = self.client.fput_object(
                 self.bucket, dest_path, src_full_path,
-                content_type=write_content_type)
+                content_type=write_content_type, **upload_options)
             logger.debug(f"Successfully copied to {dest_path}: {result}")
             return result
         except Exception as e:
             logger.error(f"Error copying file to object storage: {str(e)}")
             raise
 
+    def copy(self, src_path, dest_path):
+        """Copy an object within the bucket.
+
+        The copy is done server side, so no data passes through the
+        client.
+
+        Args:
+            src_path (str): The existing object path.
+            dest_path (str): The object path to copy to.
+        """
+        from minio.commonconfig import CopySource
+
+        logger.info(f"Copying object {src_path} to {dest_path}...")
+        try:
+            result = self.client.copy_object(
+                self.bucket, dest_path, CopySource(self.bucket, src_path))
+            logger.debug(f"Successfully copied to {dest_path}: {result}")
+            return result
+        except Exception as e:
+            logger.error(f"Error copying object: {str(e)}")
+            raise
+
     def ls(self, path=None, pattern="*"):
         """List objects in storage."""
-        objects = []
+        objects = list(self.iter_ls(path, pattern))
+        logger.info(f"Found {len(objects)} objects matching pattern")
+        return objects
+
+    def iter_ls(self, path=None, pattern="*"):
+        """Yield matching object names while the listing is paged in.
+
+        The literal part of the pattern before its first wildcard is
+        sent to the server as the listing prefix, so only candidate
+        objects are transferred; the rest is matched locally.
+        """
         prefix = path or ""
+        pattern = pattern or "*"
+        pattern_prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+        if pattern_prefix.startswith(prefix):
+            prefix = pattern_prefix
+        elif not prefix.startswith(pattern_prefix):
+            # No key under path can start with the pattern's prefix
+            return
         logger.info(f"Listing objects in bucket={self.bucket}, "
                     f"prefix={prefix}, "
                     f"pattern={pattern}")
 
+        # Compile the pattern once rather than matching every name
+        # through fnmatch
+        match = re.compile(fnmatch.translate(pattern)).match
         try:
             for obj in self.client.list_objects(
                     self.bucket, prefix=prefix, recursive=True):
-                if pattern == "*" or fnmatch.fnmatch(obj.object_name,
-                                                     pattern):
-                    objects.append(obj.object_name)
+                if pattern == "*" or match(obj.object_name):
                     logger.debug(f"Found object: {obj.object_name}")
-
-            logger.info(f"Found {len(objects)} objects matching pattern")
-            return objects
+                    yield obj.object_name
         except Exception as e:
             logger.error(f"Error listing objects: {str(e)}")
             raise
@@ -421,20 +638,10 @@ class ObjectStorage(BaseStorage):
 
         try:
             if recursive:
-                # List all objects under the prefix
-                objects = self.client.list_objects(
-                    self.bucket,
-                    prefix=path,
-                    recursive=True
-                )
-                # Remove all objects
-                for obj in objects:
-                    self.client.remove_object(self.bucket, obj.object_name)
-                    logger.debug(
-                        f"Removed object: {obj.object_name}"
-                    )
+                removed = self._remove_prefix(path)
                 logger.info(
-                    f"Recursively removed all objects under prefix: {path}"
+                    f"Recursively removed {removed} objects under prefix: "
+                    f"{path}"
                 )
             else:
                 # Check if it's a prefix (directory)
@@ -456,16 +663,86 @@ class ObjectStorage(BaseStorage):
             )
             raise
 
+    def _remove_prefix(self, prefix):
+        """Remove all objects under a prefix with multi-object deletes.
+
+        Returns:
+            int: Number of objects removed.
+        """
+        objects = self.client.list_objects(
+            self.bucket, prefix=prefix, recursive=True)
+        return self.rm_many(obj.object_name for obj in objects)
+
+    def rm_many(self, paths):
+        """Remove many objects with multi-object deletes.
+
+        The paths are consumed lazily into batches of DELETE_BATCH_SIZE
+        keys, each removed with a single DeleteObjects request; up to
+        DELETE_CONCURRENCY batches are in flight at once.
+
+        Args:
+            paths (Iterable[str]): The paths to remove.
+
+        Returns:
+            int: Number of objects removed.
+
+        Raises:
+            OSError: If any object could not be removed.
+        """
+        from minio.deleteobjects import DeleteObject
+
+        def remove_batch(names):
+            errors = list(self.client.remove_objects(
+                self.bucket, [DeleteObject(name) for name in names]))
+            for err in errors:
+                logger.error(
+                    f"Error removing object {err.name}: {err.message}"
+                )
+            return len(names), len(errors)
+
+        removed = 0
+        failed = 0
+        pending = deque()
+        with ThreadPoolExecutor(
+                max_workers=self.DELETE_CONCURRENCY) as executor:
+            batch = []
+            for path in paths:
+                batch.append(path)
+                if len(batch) == self.DELETE_BATCH_SIZE:
+                    pending.append(executor.submit(remove_batch, batch))
+                    batch = []
+                # Bound the keys held in memory
+                if len(pending) >= self.DELETE_CONCURRENCY:
+                    count, errors = pending.popleft().result()
+                    removed += count - errors
+                    failed += errors
+            if batch:
+                pending.append(executor.submit(remove_batch, batch))
+            while pending:
+                count, errors = pending.popleft().result()
+                removed += count - errors
+                failed += errors
+
+        if failed:
+            raise OSError(f"Failed to remove {failed} objects")
+        return removed
+
     def download(
         self,
         path,
         dest_path,
         chunk_size=8*1024*1024,
-        show_progress=True
+        show_progress=True,
+        concurrency=1,
+        progress=None
     ):
         """Download an object from storage with support for chunked download,
         progress display and resume capability.
 
+        With concurrency above 1, objects larger than one chunk are
+        fetched as parallel ranged GETs written in place; such downloads
+        are restarted rather than resumed.
+
         Args:
             path (str): The path of the object in storage.
             dest_path (str): The local path where the object will be saved.
@@ -473,6 +750,11 @@ class ObjectStorage(BaseStorage):
                 Defaults to 8MB.
             show_progress (bool, optional): Whether to display download
                 progress. Defaults to True.
+            concurrency (int, optional): Number of ranges downloaded in
+                parallel. Defaults to 1.
+            progress (optional): Object with set_meta(object_name,
+                total_length) and update(length) methods, used instead
+                of the printed progress.
 
         Returns:
             str: The path where the file was saved.
@@ -490,6 +772,26 @@ class ObjectStorage(BaseStorage):
             stat = self.client.stat_object(self.bucket, path)
             total_size = stat.size
             logger.debug(f"Object size: {total_size} bytes")
+            if progress is not None:
+                progress.set_meta(path, total_size)
+                show_progress = False
+
+            if concurrency > 1 and total_size > chunk_size:
+                # Parallel parts go to their own file, so an interrupted
+                # run is never mistaken for a resumable sequential one
+                temp_path = f"{dest_path}.parts"
+                self._download_ranges(
+                    path, temp_path, total_size, chunk_size,
+                    concurrency, progress
+                )
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
+                os.rename(temp_path, dest_path)
+                logger.info(
+                    f"Successfully downloaded {total_size} bytes to "
+                    f"{dest_path}"
+                )
+                return dest_path
 
             # Create temporary file for download
             temp_path = f"{dest_path}.download"
@@ -532,6 +834,8 @@ class ObjectStorage(BaseStorage):
 
                     f.write(chunk)
                     downloaded += len(chunk)
+                    if progress is not None:
+                        progress.update(len(chunk))
 
                     # Show progress
                     if show_progress:
@@ -568,6 +872,46 @@ class ObjectStorage(BaseStorage):
                 response.close()
                 response.release_conn()
 
+    def _download_ranges(
+        self,
+        path,
+        temp_path,
+        total_size,
+        chunk_size,
+        concurrency,
+        progress=None
+    ):
+        """Download an object as parallel ranged GETs into temp_path.
+
+        Each range is streamed to its own offset of a file preallocated
+        to the object size.
+        """
+        with open(temp_path, "wb") as f:
+            f.truncate(total_size)
+
+        def fetch(offset):
+            length = min(chunk_size, total_size - offset)
+            response = self.client.get_object(
+                self.bucket, path, offset=offset, length=length)
+            try:
+                with open(temp_path, "r+b") as f:
+                    f.seek(offset)
+                    for data in response.stream(1024 * 1024):
+                        f.write(data)
+                        if progress is not None:
+                            progress.update(len(data))
+            finally:
+                response.close()
+                response.release_conn()
+
+        logger.info(
+            f"Downloading {total_size} bytes in {chunk_size} byte parts "
+            f"with {concurrency} connections"
+        )
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Consume the iterator so worker errors are raised here
+            list(executor.map(fetch, range(0, total_size, chunk_size)))
+
     def get_presigned_upload_url(self, path, expires_minutes=10):
         """Generate a presigned URL for uploading objects to storage.
 
@@ -701,6 +1045,15 @@ class FileStorage(BaseStorage):
                          f"error: {str(e)}")
             raise
 
+    def open(self, path):
+        """Open a file as a binary stream for reading."""
+        target_path = os.path.join(self.base_path, path)
+        # check if full path passed, use full path by default
+        if self.base_path in path:
+            target_path = path
+        logger.info(f"Opening from storage: {target_path}...")
+        return open(target_path, "rb")
+
     def write(self, path, content,
               content_type=TEXT_CONTENT_TYPE, *args, **kwargs):
         """Write content to file system."""
@@ -723,6 +1076,25 @@ class FileStorage(BaseStorage):
                          f"error: {str(e)}")
             raise
 
+    def write_stream(self, path, stream, content_type=TEXT_CONTENT_TYPE):
+        """Write a binary stream to file system, returning bytes written."""
+        target_path = os.path.join(self.base_path, path)
+        self._ensure_path_exists(os.path.dirname(target_path))
+        logger.info(f"Streaming content type {content_type} to storage: "
+                    f"{target_path}...")
+
+        try:
+            with open(target_path, "wb") as f:
+                shutil.copyfileobj(stream, f, 1024 * 1024)
+                bytes_written = f.tell()
+            logger.debug(f"Successfully wrote {bytes_written} bytes to "
+                         f"{target_path}")
+            return bytes_written
+        except Exception as e:
+            logger.error(f"Error writing to file: {target_path}, "
+                         f"error: {str(e)}")
+            raise
+
     def exists(self, path, *args, **kwargs):
         """Check if file exists in file system."""
         target_path = os.path.join(self.base_path, path)
@@ -754,18 +1126,47 @@ class FileStorage(BaseStorage):
             logger.error(f"Error copying file: {str(e)}")
             raise
 
+    def copy(self, src_path, dest_path):
+        """Copy a stored file.
+
+        The copy never shares an inode with the source, since write and
+        cp_from_path rewrite files in place.
+        """
+        src_target = os.path.join(self.base_path, src_path)
+        dest_target = os.path.join(self.base_path, dest_path)
+        self._ensure_path_exists(os.path.dirname(dest_target))
+        logger.info(f"Copy {src_target} to {dest_target}...")
+
+        try:
+            # Removed first so a destination hardlinked by earlier
+            # versions is not written through
+            if os.path.exists(dest_target):
+                os.remove(dest_target)
+            shutil.copy(src_target, dest_target)
+            logger.debug(f"Successfully copied file to {dest_target}")
+        except Exception as e:
+            logger.error(f"Error copying file: {str(e)}")
+            raise
+
     def ls(self, path="", pattern=None):
         """List files in directory."""
         target_path = os.path.join(self.base_path, path)
         logger.info(f"Listing files in: {target_path}")
 
+        # Compile the pattern once, normalizing case like fnmatch does
+        match = None
+        if pattern is not None:
+            match = re.compile(
+                fnmatch.translate(os.path.normcase(pattern))
+            ).match
+
         try:
             files = []
             for root, _, filenames in os.walk(target_path):
                 for filename in filenames:
                     file_path = os.path.join(root, filename)
                     rel_path = os.path.relpath(file_path, self.base_path)
-                    if pattern is None or fnmatch.fnmatch(rel_path, pattern):
+                    if match is None or match(os.path.normcase(rel_path)):
                         files.append(rel_path)
             return sorted(files)
         except Exception as e:
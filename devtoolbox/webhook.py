@@ -18,10 +18,80 @@ Note:
 """
 import logging
 import json
+import os
+import uuid
+from io import BytesIO
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 import requests
+from urllib3.fields import RequestField
 
 logger = logging.getLogger(__name__)
 
+# HTTP session shared by all webhooks, so repeated sends reuse pooled
+# connections instead of a new TCP and TLS handshake each time
+_session = None
+
+
+def _get_session():
+    """Get the shared HTTP session, creating it on first use."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+class _MultipartFile:
+    """
+    multipart/form-data body with a single file field, read lazily.
+
+    requests builds multipart bodies passed as files= in memory; this
+    one is read from disk in blocks as it is sent, with its length known
+    up front so it goes out with a Content-Length header.
+    """
+
+    def __init__(self, field, file_path):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        part = RequestField(
+            name=field, data=b"", filename=os.path.basename(file_path)
+        )
+        part.make_multipart(content_type="application/octet-stream")
+        head = f"--{boundary}\r\n{part.render_headers()}".encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+        self._file = open(file_path, "rb")
+        self._length = (
+            len(head) + os.fstat(self._file.fileno()).st_size + len(tail)
+        )
+        self._parts = [BytesIO(head), self._file, BytesIO(tail)]
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0)
+                continue
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def __iter__(self):
+        return iter(lambda: self.read(64 * 1024), b"")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class Webhook:
     """
@@ -38,12 +108,15 @@ class Webhook:
     and message types as needed.
     """
 
-    def __init__(self, webhook_url):
+    def __init__(self, webhook_url, session=None):
         """
         Initialize the Webhook class with the provided webhook URL.
         :param webhook_url: The URL of the webhook.
+        :param session: requests.Session to send with. Defaults to a
+                        session shared by all Webhook instances.
         """
         self.webhook_url = webhook_url
+        self.session = session or _get_session()
 
     def send_text_message(
         self, content, mentioned_list=None, mentioned_mobile_list=None
@@ -127,6 +200,45 @@ class Webhook:
             f"{self.webhook_url}"
         )
 
+    def upload_media(self, file_path, media_type="file"):
+        """
+        Upload a file through the WeCom webhook media interface.
+
+        The file is sent as raw multipart form data, so unlike image
+        messages it is not base64-encoded and is uploaded at its real
+        size. It is streamed from disk rather than loaded into memory.
+        :param file_path: Path of the file to upload.
+        :param media_type: WeCom media type ("file" or "voice").
+        :return: Media ID to use with send_file_message.
+        :raises: requests.exceptions.RequestException if request fails
+        :raises: ValueError if WeCom rejects the upload
+        """
+        # The upload URL is the send URL with the same key
+        parts = urlsplit(self.webhook_url)
+        path = parts.path.rsplit("/", 1)[0] + "/upload_media"
+        query = dict(parse_qsl(parts.query))
+        query["type"] = media_type
+        upload_url = urlunsplit(
+            parts._replace(path=path, query=urlencode(query))
+        )
+        logger.debug(f"Uploading {file_path} to WeCom media interface")
+
+        with _MultipartFile("media", file_path) as body:
+            response = self.session.post(
+                upload_url,
+                data=body,
+                headers={"Content-Type": body.content_type}
+            )
+        response.raise_for_status()
+        result = response.json()
+        if result.get("errcode", 0) != 0:
+            raise ValueError(
+                f"Failed to upload media: {result.get('errmsg')}"
+            )
+
+        logger.info(f"Uploaded {file_path} as media {result['media_id']}")
+        return result["media_id"]
+
     def send_feishu_card_message(
         self,
         title: str,
@@ -204,7 +316,7 @@ class Webhook:
 
         try:
             # Send POST request to webhook
-            response = requests.post(
+            response = self.session.post(
                 self.webhook_url,
                 headers=headers,
                 data=json.dumps(payload)
@@ -0,0 +1,44 @@
+"""Unit tests for the storage commands.
+
+This module tests the storage CLI against local file storage:
+- Downloading every matching file under a directory
+"""
+
+from typer.testing import CliRunner
+
+from devtoolbox.cli.commands.storage import app
+
+runner = CliRunner()
+
+
+class TestDownloadMany:
+    """Tests for the download-many command."""
+
+    def test_downloads_matching_files(self, tmp_path, monkeypatch):
+        """Test files under a relative directory keep their layout."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        (source / "nested").mkdir(parents=True)
+        (source / "first.txt").write_text("first")
+        (source / "nested" / "second.txt").write_text("second")
+        (source / "skipped.log").write_text("skipped")
+
+        result = runner.invoke(
+            app, ["download-many", "source", "output", "-p", "*.txt"]
+        )
+
+        assert result.exit_code == 0, result.output
+        output = tmp_path / "output"
+        assert (output / "first.txt").read_text() == "first"
+        assert (output / "nested" / "second.txt").read_text() == "second"
+        assert not (output / "skipped.log").exists()
+
+    def test_no_matching_files(self, tmp_path, monkeypatch):
+        """Test an empty match is reported as a failure."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "source").mkdir()
+
+        result = runner.invoke(app, ["download-many", "source", "output"])
+
+        assert result.exit_code == 1
+        assert "No files found" in result.output
@@ -0,0 +1,64 @@
+"""Unit tests for the image converter.
+
+This module tests ImageConverter behavior that callers rely on:
+- Cached resize results of file sources
+- Reduced JPEG decodes not leaking into later resizes
+"""
+
+from io import BytesIO
+
+from PIL import Image
+
+from devtoolbox.images.convertor import ImageConverter
+
+
+def _resize_file(path, width):
+    """Resize a file and return the size of the resized image."""
+    with ImageConverter(str(path)) as converter:
+        output_path = converter.resize(width)
+    with Image.open(output_path) as image:
+        return image.size
+
+
+class TestResizeCache:
+    """Tests for the cache of resize results."""
+
+    def test_file_resized_again_after_other_width(self, tmp_path):
+        """A cached resize is not reused once its file is overwritten."""
+        path = tmp_path / "image.png"
+        Image.new("RGB", (400, 300), (255, 0, 0)).save(path)
+
+        assert _resize_file(path, 100) == (100, 75)
+        # Writes the same output file at another width
+        assert _resize_file(path, 50) == (50, 38)
+        assert _resize_file(path, 100) == (100, 75)
+
+    def test_bytes_result_reused(self):
+        """Resizing the same bytes again returns the cached result."""
+        output = BytesIO()
+        Image.new("RGB", (400, 300), (0, 0, 255)).save(output, "PNG")
+        source = output.getvalue()
+
+        first = ImageConverter(source).resize(100)
+        second = ImageConverter(source).resize(100)
+
+        assert second is first
+        with Image.open(BytesIO(first)) as image:
+            assert image.size == (100, 75)
+
+
+class TestResizeImage:
+    """Tests for resizing without encoding."""
+
+    def test_large_resize_after_small_one(self, tmp_path):
+        """A reduced decode for a small resize is not reused."""
+        path = tmp_path / "image.jpg"
+        Image.new("RGB", (4000, 3000), (0, 128, 0)).save(path)
+
+        with ImageConverter(str(path), output_format="jpeg") as converter:
+            small = converter.resize_image(100)
+            large = converter.resize_image(2000)
+            assert converter._open().size == (4000, 3000)
+
+        assert small.size == (100, 75)
+        assert large.size == (2000, 1500)
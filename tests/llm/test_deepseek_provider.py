@@ -21,11 +21,8 @@ from devtoolbox.llm.openai_provider import (
 
 @pytest.fixture
 def mock_retry():
-    """Mock the retry decorator to simulate a single retry attempt."""
-    with patch('devtoolbox.llm.openai_provider.retry') as mock:
-        mock.side_effect = (
-            lambda *args, **kwargs: lambda f: f
-        )
+    """Skip the waits between retry attempts."""
+    with patch.object(DeepSeekProvider.chat.retry, 'sleep') as mock:
         yield mock
 
 
@@ -7,7 +7,7 @@ implementation, focusing on testing the logic of each method using mocks.
 import os
 from unittest.mock import MagicMock, patch
 import pytest
-from openai import RateLimitError, APIError
+from openai import RateLimitError, APIError, APIConnectionError
 from langchain_core.messages import AIMessage, SystemMessage, HumanMessage
 from tenacity import RetryError
 import warnings
@@ -22,11 +22,8 @@ from devtoolbox.llm.openai_provider import (
 
 @pytest.fixture
 def mock_retry():
-    """Mock the retry decorator to simulate a single retry attempt."""
-    with patch('devtoolbox.llm.openai_provider.retry') as mock:
-        mock.side_effect = (
-            lambda *args, **kwargs: lambda f: f
-        )
+    """Skip the waits between retry attempts."""
+    with patch.object(OpenAIProvider.chat.retry, 'sleep') as mock:
         yield mock
 
 
@@ -129,6 +126,24 @@ class TestOpenAIProvider:
         assert response.content == "Success"
         assert openai_provider.llm.invoke.call_count == 2
 
+    def test_chat_connection_error_retry(
+        self, openai_provider, mock_chat_openai, mock_retry
+    ):
+        """Test chat retries on transient connection errors"""
+        error = APIConnectionError(request=MagicMock())
+        success_response = AIMessage(content="Success")
+
+        openai_provider.llm.invoke.side_effect = [
+            error,
+            success_response
+        ]
+
+        messages = [{"role": "user", "content": "Hello"}]
+        response = openai_provider.chat(messages)
+
+        assert response.content == "Success"
+        assert openai_provider.llm.invoke.call_count == 2
+
     def test_embed_with_langchain(self, openai_provider, mock_chat_openai):
         """Test embedding generation using LangChain client"""
         mock_embedding = [0.1, 0.2, 0.3]
@@ -0,0 +1,55 @@
+"""Unit tests for the recognize-batch command helpers.
+
+This module tests how a batch is prepared before any OCR request:
+- Parallel validation splitting valid and invalid files
+- Detection of files that would write the same result file
+"""
+
+from pathlib import Path
+
+from PIL import Image
+
+from devtoolbox.cli.commands.ocr import _prevalidate, _stem_collisions
+
+
+class TestPrevalidate:
+    """Tests for the parallel validation of a batch."""
+
+    def test_splits_valid_and_invalid_files(self, tmp_path):
+        """Test valid files are kept in order and invalid ones reported."""
+        first = tmp_path / "first.png"
+        Image.new("RGB", (200, 100)).save(first)
+        too_small = tmp_path / "small.png"
+        Image.new("RGB", (10, 10)).save(too_small)
+        second = tmp_path / "second.jpg"
+        Image.new("RGB", (100, 200)).save(second)
+        not_image = tmp_path / "notes.png"
+        not_image.write_text("not an image")
+
+        valid, invalid = _prevalidate(
+            [first, too_small, second, not_image], "azure", workers=2
+        )
+
+        assert valid == [first, second]
+        assert [path for path, _ in invalid] == [too_small, not_image]
+        assert "too small" in invalid[0][1]
+
+    def test_empty_batch(self):
+        """Test an empty batch needs no validation."""
+        assert _prevalidate([], "azure") == ([], [])
+
+
+class TestStemCollisions:
+    """Tests for detecting files that share a result file name."""
+
+    def test_reports_shared_stems(self):
+        """Test files with the same stem in any directory are reported."""
+        paths = [Path("a/x.png"), Path("b/x.jpg"), Path("a/y.png")]
+
+        assert _stem_collisions(paths) == {
+            "x": [Path("a/x.png"), Path("b/x.jpg")]
+        }
+
+    def test_unique_stems(self):
+        """Test no collisions are reported for unique stems."""
+        assert _stem_collisions([Path("x.png"), Path("y.png")]) == {}
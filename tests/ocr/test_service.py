@@ -398,3 +398,14 @@ class TestOCRService:
         for line in result:
             assert isinstance(line, str)
             assert not hasattr(line, 'confidence')
+
+    def test_recognize_skips_validation_when_disabled(self, ocr_service):
+        """Test validate=False skips the compliance check."""
+        ocr_service.provider.validate_image_compliance = MagicMock(
+            return_value=(False, "too small")
+        )
+
+        result = ocr_service.recognize("image.png", validate=False)
+
+        assert len(result) == 3
+        ocr_service.provider.validate_image_compliance.assert_not_called()
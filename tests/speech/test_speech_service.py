@@ -0,0 +1,156 @@
+"""Unit tests for speech service chunk transcription.
+
+This module tests how SpeechService transcribes the chunks of an audio
+file with a fake provider:
+- Transcripts are returned in chunk order with concurrent workers
+- Cached chunks are not transcribed again
+- Providers that are not thread safe get a single worker
+- Errors raised in workers propagate
+
+Audio splitting and transcoding are mocked.
+"""
+
+import os
+import shutil
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from devtoolbox.speech.service import SpeechService
+from devtoolbox.speech.utils import ChunkMeta
+
+CHUNK_COUNT = 6
+
+
+class FakeProvider:
+    """Fake provider writing the chunk file name as its transcript.
+
+    Earlier chunks take longer, so with concurrent workers they finish
+    after later ones.
+    """
+
+    supports_concurrent_transcription = True
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def transcribe(self, speech_path, output_path):
+        name = os.path.basename(speech_path)
+        with self._lock:
+            self.calls.append(name)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            index = int(name.split("_")[1].split(".")[0])
+            time.sleep(0.01 * (CHUNK_COUNT - index))
+            if name == self.fail_on:
+                raise RuntimeError(f"Failed to transcribe {name}")
+            with open(output_path, "w") as f:
+                f.write(f"text of {name}")
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def chunk_dirs(tmp_path):
+    """Create temp and cache directories for chunk processing."""
+    temp_dir = tmp_path / "temp"
+    cache_dir = tmp_path / "cache"
+    temp_dir.mkdir()
+    cache_dir.mkdir()
+    return str(temp_dir), str(cache_dir)
+
+
+def _make_chunks(temp_dir):
+    """Create chunk wav files with distinct content."""
+    chunks = []
+    for index in range(CHUNK_COUNT):
+        wav_path = os.path.join(temp_dir, f"chunk_{index}.wav")
+        with open(wav_path, "wb") as f:
+            f.write(f"audio {index}".encode())
+        chunks.append(ChunkMeta(index=index, wav_path=wav_path))
+    return chunks
+
+
+def _process(provider, temp_dir, cache_dir, jobs, use_cache=True):
+    """Run _process_audio_chunks with a fake provider."""
+    service = SpeechService.__new__(SpeechService)
+    service.provider = provider
+    with patch(
+        "devtoolbox.speech.service.split_speech_chunks",
+        return_value=_make_chunks(temp_dir)
+    ), patch(
+        "devtoolbox.speech.service.convert_audio_ffmpeg",
+        side_effect=lambda src, dst, **kwargs: shutil.copyfile(src, dst)
+    ):
+        return service._process_audio_chunks(
+            "speech.wav", temp_dir, cache_dir,
+            use_cache=use_cache, jobs=jobs
+        )
+
+
+class TestProcessAudioChunks:
+    """Tests for concurrent chunk transcription."""
+
+    def test_transcripts_in_chunk_order(self, chunk_dirs):
+        """Test transcripts keep chunk order with several workers."""
+        provider = FakeProvider()
+
+        chunks = _process(provider, *chunk_dirs, jobs=4)
+
+        assert [chunk.index for chunk in chunks] == list(range(CHUNK_COUNT))
+        assert [chunk.transcript for chunk in chunks] == [
+            f"text of chunk_{index}.wav" for index in range(CHUNK_COUNT)
+        ]
+        assert provider.peak > 1
+
+    def test_cached_chunks_not_transcribed_again(self, chunk_dirs):
+        """Test a second run serves every chunk from the cache."""
+        provider = FakeProvider()
+        first = _process(provider, *chunk_dirs, jobs=4)
+        assert len(provider.calls) == CHUNK_COUNT
+
+        second = _process(provider, *chunk_dirs, jobs=4)
+
+        assert len(provider.calls) == CHUNK_COUNT
+        assert all(chunk.cached for chunk in second)
+        assert [chunk.transcript for chunk in second] == [
+            chunk.transcript for chunk in first
+        ]
+
+    def test_no_cache_transcribes_again(self, chunk_dirs):
+        """Test use_cache=False ignores cached transcripts."""
+        provider = FakeProvider()
+        _process(provider, *chunk_dirs, jobs=2)
+
+        chunks = _process(provider, *chunk_dirs, jobs=2, use_cache=False)
+
+        assert len(provider.calls) == 2 * CHUNK_COUNT
+        assert not any(chunk.cached for chunk in chunks)
+
+    def test_single_worker_without_concurrent_support(self, chunk_dirs):
+        """Test providers that are not thread safe get one worker."""
+        provider = FakeProvider()
+        provider.supports_concurrent_transcription = False
+
+        chunks = _process(provider, *chunk_dirs, jobs=4)
+
+        assert provider.peak == 1
+        assert provider.calls == [
+            f"chunk_{index}.wav" for index in range(CHUNK_COUNT)
+        ]
+        assert all(chunk.transcript for chunk in chunks)
+
+    def test_worker_error_propagates(self, chunk_dirs):
+        """Test an error in a transcription worker is raised."""
+        provider = FakeProvider(fail_on="chunk_3.wav")
+
+        with pytest.raises(RuntimeError, match="chunk_3.wav"):
+            _process(provider, *chunk_dirs, jobs=4)